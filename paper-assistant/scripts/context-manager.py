@@ -6,17 +6,35 @@ Manages .paper_context.json file for state persistence,
 stage transitions, and context propagation across the paper writing workflow.
 """
 
+from __future__ import annotations
+
 import json
 import sys
-from datetime import datetime
-from pathlib import Path
-from typing import Dict, List, Optional, Any
+from types import MappingProxyType
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Any, Mapping
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_STATUSES = ("pending", "in_progress", "completed", "failed")
+_VALID_STATUSES = frozenset(_STATUSES)
+
+_REQUIRED_FIELDS = ("project", "current_stage", "user_preferences", "stages")
+_REQUIRED_FIELD_SET = frozenset(_REQUIRED_FIELDS)
 
 
 class ContextManager:
     """Manages paper project context and state persistence."""
 
     STAGES_ORDER = ["literature_review", "hypothesis", "code", "experiment", "writing"]
+    STAGES_SET = frozenset(STAGES_ORDER)
+    STAGE_INDEX = {stage: idx for idx, stage in enumerate(STAGES_ORDER)}
 
     def __init__(self, project_path: str):
         """Initialize context manager for a project.
@@ -27,18 +45,38 @@ class ContextManager:
         Raises:
             ValueError: If project_path does not exist
         """
-        self.project_path = Path(project_path).resolve()
-        if not self.project_path.exists():
+        from pathlib import Path
+
+        try:
+            project_dir = Path(project_path).resolve(strict=True)
+        except FileNotFoundError:
             raise ValueError(f"Project path does not exist: {project_path}")
 
+        self._bind(project_dir)
+
+    def _bind(self, project_dir: Path) -> None:
+        """Attach the manager to an already-resolved project directory."""
+        self.project_path = project_dir
         self.context_file = self.project_path / ".paper_context.json"
-        self.context: Dict[str, Any] = {}
+        self.context: dict[str, Any] = {}
+
+    @classmethod
+    def _from_resolved(cls, project_dir: Path) -> ContextManager:
+        """Create a manager for a directory known to exist, skipping the checks."""
+        manager = cls.__new__(cls)
+        manager._bind(project_dir)
+        return manager
 
-    def load_context(self) -> Dict[str, Any]:
+    def load_context(self, copy: bool = False) -> Mapping[str, Any]:
         """Load context from .paper_context.json file.
 
+        Args:
+            copy: Return a mutable shallow copy instead of a read-only view
+
         Returns:
-            Context dictionary with project metadata, stages, and preferences
+            Context mapping with project metadata, stages, and preferences.
+            Unless copy is True, this is a read-only view of the manager's
+            internal state; use dict(...) or copy=True to get a mutable dict.
 
         Raises:
             FileNotFoundError: If context file doesn't exist
@@ -51,22 +89,30 @@ class ContextManager:
             )
 
         try:
-            with open(self.context_file, "r", encoding="utf-8") as f:
-                self.context = json.load(f)
-            return self.context.copy()
+            if orjson is not None:
+                self.context = orjson.loads(self.context_file.read_bytes())
+            else:
+                with open(self.context_file, "r", encoding="utf-8") as f:
+                    self.context = json.load(f)
+            return self.context.copy() if copy else MappingProxyType(self.context)
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in context file: {e}")
 
-    def save_context(self, context: Optional[Dict[str, Any]] = None) -> None:
+    def save_context(
+        self, context: dict[str, Any] | None = None, timestamp: str | None = None
+    ) -> None:
         """Save context to .paper_context.json file.
 
         Args:
             context: Context dictionary to save. If None, saves current context.
+            timestamp: ISO timestamp for last_updated. If None, uses the current time.
 
         Raises:
             ValueError: If context is invalid
             IOError: If unable to write file
         """
+        from datetime import datetime
+
         if context is not None:
             self._validate_context(context)
             self.context = context
@@ -75,15 +121,24 @@ class ContextManager:
 
         if "project" not in self.context:
             self.context["project"] = {}
-        self.context["project"]["last_updated"] = datetime.now().isoformat()
+        self.context["project"]["last_updated"] = (
+            timestamp or datetime.now().isoformat()
+        )
 
         try:
-            with open(self.context_file, "w", encoding="utf-8") as f:
-                json.dump(self.context, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                payload = orjson.dumps(
+                    self.context,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                )
+                self.context_file.write_bytes(payload)
+            else:
+                data = json.dumps(self.context, indent=2, ensure_ascii=False)
+                self.context_file.write_text(data, encoding="utf-8")
         except IOError as e:
             raise IOError(f"Failed to save context: {e}")
 
-    def update_stage(self, stage: str, data: Dict[str, Any]) -> None:
+    def update_stage(self, stage: str, data: dict[str, Any]) -> None:
         """Update a specific stage with new data.
 
         Args:
@@ -93,7 +148,7 @@ class ContextManager:
         Raises:
             ValueError: If stage name is invalid or data is invalid
         """
-        if stage not in self.STAGES_ORDER:
+        if stage not in self.STAGES_SET:
             raise ValueError(
                 f"Invalid stage: {stage}. Valid stages: {', '.join(self.STAGES_ORDER)}"
             )
@@ -101,16 +156,11 @@ class ContextManager:
         if not isinstance(data, dict):
             raise ValueError("Stage data must be a dictionary")
 
-        if "stages" not in self.context:
-            self.context["stages"] = {}
-
-        if stage not in self.context["stages"]:
-            self.context["stages"][stage] = {}
-
-        self.context["stages"][stage].update(data)
+        stage_data = self.context.setdefault("stages", {}).setdefault(stage, {})
+        stage_data.update(data)
 
         if "status" not in data:
-            self.context["stages"][stage]["status"] = "in_progress"
+            stage_data["status"] = "in_progress"
 
         self.context["current_stage"] = stage
 
@@ -126,43 +176,41 @@ class ContextManager:
         Raises:
             ValueError: If target_stage is not a valid stage name
         """
-        if target_stage not in self.STAGES_ORDER:
+        if target_stage not in self.STAGES_SET:
             raise ValueError(f"Invalid target stage: {target_stage}")
 
-        target_idx = self.STAGES_ORDER.index(target_stage)
+        target_idx = self.STAGE_INDEX[target_stage]
 
+        stages = self.context.get("stages", {})
         for stage in self.STAGES_ORDER[target_idx + 1 :]:
-            if stage in self.context.get("stages", {}):
-                self.context["stages"][stage]["status"] = "pending"
-
-                stage_data = self.context["stages"][stage]
-                stage_keys_to_keep = {"status"}
-                for key in list(stage_data.keys()):
-                    if key not in stage_keys_to_keep:
-                        del stage_data[key]
+            if stage in stages:
+                stages[stage] = {"status": "pending"}
 
         self.context["current_stage"] = target_stage
-        self.context["stages"][target_stage]["status"] = "in_progress"
+        stages[target_stage]["status"] = "in_progress"
 
-    def get_stage_output(self, stage: str) -> Dict[str, Any]:
+    def get_stage_output(self, stage: str, copy: bool = False) -> dict[str, Any]:
         """Get output data for a specific stage.
 
         Args:
             stage: Stage name
+            copy: Return a shallow copy instead of the internal stage dict
 
         Returns:
-            Dictionary containing stage output data
+            Dictionary containing stage output data. Unless copy is True,
+            this aliases the manager's internal state.
 
         Raises:
             ValueError: If stage is invalid or not found
         """
-        if stage not in self.STAGES_ORDER:
+        if stage not in self.STAGES_SET:
             raise ValueError(f"Invalid stage: {stage}")
 
         if "stages" not in self.context or stage not in self.context["stages"]:
             raise ValueError(f"Stage data not found: {stage}")
 
-        return self.context["stages"][stage].copy()
+        stage_data = self.context["stages"][stage]
+        return stage_data.copy() if copy else stage_data
 
     def get_current_stage(self) -> str:
         """Get the current active stage.
@@ -187,11 +235,9 @@ class ContextManager:
         Returns:
             True if stage status is 'completed', False otherwise
         """
-        try:
-            stage_data = self.get_stage_output(stage)
-            return stage_data.get("status") == "completed"
-        except ValueError:
-            return False
+        return (
+            self.context.get("stages", {}).get(stage, {}).get("status") == "completed"
+        )
 
     def set_stage_status(self, stage: str, status: str) -> None:
         """Set the status of a specific stage.
@@ -203,24 +249,18 @@ class ContextManager:
         Raises:
             ValueError: If stage or status is invalid
         """
-        valid_statuses = ["pending", "in_progress", "completed", "failed"]
-        if status not in valid_statuses:
+        if status not in _VALID_STATUSES:
             raise ValueError(
-                f"Invalid status: {status}. Valid statuses: {', '.join(valid_statuses)}"
+                f"Invalid status: {status}. Valid statuses: {', '.join(_STATUSES)}"
             )
 
-        if stage not in self.STAGES_ORDER:
+        if stage not in self.STAGES_SET:
             raise ValueError(f"Invalid stage: {stage}")
 
-        if "stages" not in self.context:
-            self.context["stages"] = {}
+        stage_data = self.context.setdefault("stages", {}).setdefault(stage, {})
+        stage_data["status"] = status
 
-        if stage not in self.context["stages"]:
-            self.context["stages"][stage] = {}
-
-        self.context["stages"][stage]["status"] = status
-
-    def get_user_preferences(self) -> Dict[str, Any]:
+    def get_user_preferences(self) -> dict[str, Any]:
         """Get user preferences from context.
 
         Returns:
@@ -228,7 +268,7 @@ class ContextManager:
         """
         return self.context.get("user_preferences", {})
 
-    def set_user_preferences(self, preferences: Dict[str, Any]) -> None:
+    def set_user_preferences(self, preferences: dict[str, Any]) -> None:
         """Update user preferences in context.
 
         Args:
@@ -239,7 +279,7 @@ class ContextManager:
 
         self.context["user_preferences"].update(preferences)
 
-    def _validate_context(self, context: Dict[str, Any]) -> None:
+    def _validate_context(self, context: dict[str, Any]) -> None:
         """Validate context structure and required fields.
 
         Args:
@@ -251,13 +291,10 @@ class ContextManager:
         if not isinstance(context, dict):
             raise ValueError("Context must be a dictionary")
 
-        required_fields = ["project", "current_stage", "user_preferences"]
-        for field in required_fields:
-            if field not in context:
-                raise ValueError(f"Missing required field: {field}")
-
-        if "stages" not in context:
-            raise ValueError("Missing 'stages' field in context")
+        missing = _REQUIRED_FIELD_SET - context.keys()
+        if missing:
+            fields = ", ".join(f for f in _REQUIRED_FIELDS if f in missing)
+            raise ValueError(f"Missing required field(s): {fields}")
 
     @classmethod
     def init_project(cls, project_path: str, **kwargs) -> "ContextManager":
@@ -270,18 +307,20 @@ class ContextManager:
         Returns:
             ContextManager instance with initialized context
         """
-        project_path_str = str(project_path)
-        project_dir = Path(project_path_str).resolve()
+        from datetime import datetime
+        from pathlib import Path
 
+        project_dir = Path(project_path).resolve()
         project_dir.mkdir(parents=True, exist_ok=True)
 
-        manager = cls(project_path_str)
+        manager = cls._from_resolved(project_dir)
 
+        now = datetime.now().isoformat()
         default_context = {
             "project": {
                 "name": kwargs.get("project_name", "my-paper"),
-                "created_at": datetime.now().isoformat(),
-                "last_updated": datetime.now().isoformat(),
+                "created_at": now,
+                "last_updated": now,
             },
             "current_stage": "literature_review",
             "stages": {
@@ -300,11 +339,79 @@ class ContextManager:
         }
 
         manager.context = default_context
-        manager.save_context()
+        manager.save_context(timestamp=now)
 
         return manager
 
 
+def _format_status(
+    context: Mapping[str, Any], title: str = "Project Status"
+) -> list[str]:
+    """Render the stage and preference report for one project context."""
+    out = [f"\n{title}:\n", "=" * 50, "\n"]
+
+    for stage in ContextManager.STAGES_ORDER:
+        stage_data = context.get("stages", {}).get(stage, {})
+        status = stage_data.get("status", "pending")
+        marker = "✓" if status == "completed" else "○"
+        out.append(f"  {marker} {stage:20s} [{status}]\n")
+
+    out += ["\nUser Preferences:\n", "-" * 50, "\n"]
+    prefs = context.get("user_preferences", {})
+    for key, value in prefs.items():
+        out.append(f"  {key:20s}: {value}\n")
+
+    return out
+
+
+def _load_project_context(project_dir: Path) -> Mapping[str, Any]:
+    """Load one project's context (worker for batch status)."""
+    return ContextManager._from_resolved(project_dir).load_context()
+
+
+def batch_status(batch_dir: str, max_workers: int | None = None) -> str:
+    """Build a combined status report for every project under batch_dir.
+
+    Args:
+        batch_dir: Directory whose immediate subdirectories are paper projects
+        max_workers: Thread pool size for loading contexts (default: executor default)
+
+    Returns:
+        Report text covering each subdirectory that has a .paper_context.json
+
+    Raises:
+        ValueError: If batch_dir does not exist or is not a directory
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from pathlib import Path
+
+    root = Path(batch_dir).resolve()
+    if not root.is_dir():
+        raise ValueError(f"Batch directory does not exist: {batch_dir}")
+
+    projects = sorted(
+        entry
+        for entry in root.iterdir()
+        if (entry / ".paper_context.json").is_file()
+    )
+
+    out = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_load_project_context, p) for p in projects]
+        for project_dir, future in zip(projects, futures):
+            try:
+                context = future.result()
+            except Exception as e:
+                out.append(f"\n{project_dir.name}: Error: {e}\n")
+                continue
+            out += _format_status(context, title=f"Project Status ({project_dir.name})")
+
+    if not projects:
+        out.append(f"No paper projects found under {root}\n")
+
+    return "".join(out)
+
+
 def main():
     """CLI interface for context manager."""
     import argparse
@@ -326,6 +433,11 @@ def main():
         "--stage",
         help="Target stage (for rollback command)"
     )
+    parser.add_argument(
+        "--batch",
+        metavar="DIR",
+        help="Report status for every project directory under DIR (for status command)"
+    )
 
     # Init command options
     parser.add_argument(
@@ -372,9 +484,6 @@ def main():
             manager = ContextManager.init_project(**init_kwargs)
             print(f"✓ Initialized paper project at {args.project}")
             print(f"  Context file: {manager.context_file}")
-            manager = ContextManager.init_project(args.project)
-            print(f"✓ Initialized paper project at {args.project}")
-            print(f"  Context file: {manager.context_file}")
 
         elif args.command == "load":
             manager = ContextManager(args.project)
@@ -384,23 +493,12 @@ def main():
             print(f"Project: {context.get('project', {}).get('name', 'unknown')}")
 
         elif args.command == "status":
-            manager = ContextManager(args.project)
-            context = manager.load_context()
-
-            print("\nProject Status:")
-            print("=" * 50)
-
-            for stage in ContextManager.STAGES_ORDER:
-                stage_data = context.get("stages", {}).get(stage, {})
-                status = stage_data.get("status", "pending")
-                marker = "✓" if status == "completed" else "○"
-                print(f"  {marker} {stage:20s} [{status}]")
-
-            print("\nUser Preferences:")
-            print("-" * 50)
-            prefs = context.get("user_preferences", {})
-            for key, value in prefs.items():
-                print(f"  {key:20s}: {value}")
+            if args.batch:
+                sys.stdout.write(batch_status(args.batch))
+            else:
+                manager = ContextManager(args.project)
+                context = manager.load_context()
+                sys.stdout.write("".join(_format_status(context)))
 
         elif args.command == "rollback":
             if not args.stage:
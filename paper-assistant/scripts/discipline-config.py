@@ -6,9 +6,26 @@ Provides discipline-specific configurations for different academic fields,
 including search APIs, code templates, experiment patterns, and writing styles.
 """
 
-from typing import Dict, List, Optional, Any
+import functools
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any
 import sys
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+_LANGUAGES = frozenset({"zh", "en", "mixed"})
+
+
+def _freeze(table: Dict[str, Dict[str, Any]]) -> Mapping[str, Mapping[str, Any]]:
+    """Wrap a two-level config table in read-only mapping proxies."""
+    return MappingProxyType(
+        {key: MappingProxyType(value) for key, value in table.items()}
+    )
+
 
 class DisciplineConfig:
     """Manages discipline-specific configurations for paper writing.
@@ -138,6 +155,16 @@ class DisciplineConfig:
         },
     }
 
+    # Shared by every instance, so expose them read-only instead of copying.
+    DISCIPLINES = _freeze(DISCIPLINES)
+    METHODOLOGIES = _freeze(METHODOLOGIES)
+    CITATION_STYLES = _freeze(CITATION_STYLES)
+
+    _METHODOLOGY_DISCIPLINES = {
+        code: frozenset(config["supported_disciplines"])
+        for code, config in METHODOLOGIES.items()
+    }
+
     def __init__(self, discipline: str):
         """Initialize discipline configuration.
 
@@ -156,13 +183,38 @@ class DisciplineConfig:
                 f"Supported disciplines: {supported}"
             )
 
-    def get_config(self) -> Dict[str, Any]:
+        self._config = self.DISCIPLINES[self.discipline]
+
+    @classmethod
+    def get(cls, discipline: str) -> "DisciplineConfig":
+        """Get a shared configuration instance for a discipline.
+
+        Instances hold no mutable state, so one instance per discipline code
+        is created and reused across calls.
+
+        Args:
+            discipline: Discipline code (case-insensitive)
+
+        Returns:
+            Shared DisciplineConfig instance
+
+        Raises:
+            ValueError: If discipline is not supported
+        """
+        return cls._get_cached(discipline.lower())
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _get_cached(cls, discipline: str) -> "DisciplineConfig":
+        return cls(discipline)
+
+    def get_config(self) -> Mapping[str, Any]:
         """Get full configuration for current discipline.
 
         Returns:
-            Dictionary containing all discipline-specific settings
+            Read-only mapping containing all discipline-specific settings
         """
-        return self.DISCIPLINES[self.discipline].copy()
+        return self._config
 
     def get_name(self) -> str:
         """Get human-readable discipline name.
@@ -170,7 +222,7 @@ class DisciplineConfig:
         Returns:
             Discipline name as string
         """
-        return self.get_config()["name"]
+        return self._config["name"]
 
     def get_search_apis(self) -> List[str]:
         """Get list of search APIs for this discipline.
@@ -178,7 +230,7 @@ class DisciplineConfig:
         Returns:
             List of API names
         """
-        return self.get_config()["search_apis"]
+        return self._config["search_apis"]
 
     def get_code_template(self) -> Optional[str]:
         """Get default code template for this discipline.
@@ -186,7 +238,7 @@ class DisciplineConfig:
         Returns:
             Template filename or None if not applicable
         """
-        return self.get_config()["code_template"]
+        return self._config["code_template"]
 
     def get_experiment_pattern(self) -> Optional[str]:
         """Get experiment pattern for this discipline.
@@ -194,7 +246,7 @@ class DisciplineConfig:
         Returns:
             Pattern name or None if not applicable
         """
-        return self.get_config()["experiment_pattern"]
+        return self._config["experiment_pattern"]
 
     def get_writing_template(self) -> str:
         """Get writing template for this discipline.
@@ -202,7 +254,7 @@ class DisciplineConfig:
         Returns:
             Template filename
         """
-        return self.get_config()["writing_template"]
+        return self._config["writing_template"]
 
     def get_citation_style(self) -> str:
         """Get default citation style for this discipline.
@@ -210,7 +262,7 @@ class DisciplineConfig:
         Returns:
             Citation style code (IEEE, APA, etc.)
         """
-        return self.get_config()["citation_style"]
+        return self._config["citation_style"]
 
     def get_default_metrics(self) -> List[str]:
         """Get default evaluation metrics for this discipline.
@@ -218,7 +270,7 @@ class DisciplineConfig:
         Returns:
             List of metric names
         """
-        return self.get_config()["default_metrics"]
+        return self._config["default_metrics"]
 
     def supports_methodology(self, methodology: str) -> bool:
         """Check if discipline supports a specific methodology.
@@ -229,11 +281,9 @@ class DisciplineConfig:
         Returns:
             True if methodology is supported, False otherwise
         """
-        if methodology not in self.METHODOLOGIES:
-            return False
-
-        meth_config = self.METHODOLOGIES[methodology]
-        return self.discipline in meth_config.get("supported_disciplines", [])
+        return self.discipline in self._METHODOLOGY_DISCIPLINES.get(
+            methodology, frozenset()
+        )
 
     @classmethod
     def list_disciplines(cls) -> Dict[str, str]:
@@ -254,7 +304,7 @@ class DisciplineConfig:
         return {code: config["name"] for code, config in cls.METHODOLOGIES.items()}
 
     @classmethod
-    def get_citation_style_info(cls, style: str) -> Optional[Dict[str, str]]:
+    def get_citation_style_info(cls, style: str) -> Optional[Mapping[str, str]]:
         """Get information about a citation style.
 
         Args:
@@ -280,27 +330,40 @@ class DisciplineConfig:
         if discipline not in self.DISCIPLINES:
             errors.append(f"Discipline {discipline} is not supported")
 
-        methodology = preferences.get("methodology", "")
-        if methodology and not self.supports_methodology(methodology):
+        methodology = preferences.get("methodology")
+        if methodology is not None and not self.supports_methodology(methodology):
             errors.append(
                 f"Methodology {methodology} not supported by discipline {discipline}"
             )
 
-        citation_style = preferences.get("citation_style", "")
-        if citation_style and citation_style not in self.CITATION_STYLES:
+        citation_style = preferences.get("citation_style")
+        if citation_style is not None and citation_style not in self.CITATION_STYLES:
             errors.append(f"Citation style {citation_style} is not supported")
 
-        language = preferences.get("language", "")
-        if language not in ["zh", "en", "mixed"]:
+        language = preferences.get("language")
+        if language is not None and language not in _LANGUAGES:
             errors.append(f"Language {language} must be zh, en, or mixed")
 
         return errors
 
 
+def _print_json(obj: Any) -> None:
+    """Pretty-print obj as JSON to stdout, using orjson when available."""
+    if orjson is not None:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(
+            orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        )
+        sys.stdout.buffer.flush()
+    else:
+        import json
+
+        print(json.dumps(obj, indent=2))
+
+
 def main():
     """CLI interface for discipline configuration."""
     import argparse
-    import json
 
     parser = argparse.ArgumentParser(
         description="Manage discipline-specific configurations for paper writing"
@@ -319,25 +382,26 @@ def main():
         if args.command == "list":
             disciplines = DisciplineConfig.list_disciplines()
 
+            out = []
             if args.json:
-                print(json.dumps(disciplines, indent=2))
+                _print_json(disciplines)
             else:
-                print("\nSupported Disciplines:")
-                print("=" * 50)
+                out += ["\nSupported Disciplines:\n", "=" * 50, "\n"]
                 for code, name in disciplines.items():
-                    print(f"  {code:12s} - {name}")
+                    out.append(f"  {code:12s} - {name}\n")
 
-            print("\nSupported Methodologies:")
-            print("-" * 50)
+            out += ["\nSupported Methodologies:\n", "-" * 50, "\n"]
             methodologies = DisciplineConfig.list_methodologies()
             for code, name in methodologies.items():
-                print(f"  {code:12s} - {name}")
+                out.append(f"  {code:12s} - {name}\n")
+
+            sys.stdout.write("".join(out))
 
         elif args.command == "info":
             if not args.discipline:
                 parser.error("--discipline is required for info command")
 
-            config = DisciplineConfig(args.discipline)
+            config = DisciplineConfig.get(args.discipline)
 
             info = {
                 "name": config.get_name(),
@@ -350,7 +414,7 @@ def main():
             }
 
             if args.json:
-                print(json.dumps(info, indent=2))
+                _print_json(info)
             else:
                 print(f"\nDiscipline: {args.discipline}")
                 print("=" * 50)
@@ -367,7 +431,7 @@ def main():
             if not args.discipline:
                 parser.error("--discipline is required for validate command")
 
-            config = DisciplineConfig(args.discipline)
+            config = DisciplineConfig.get(args.discipline)
 
             sample_preferences = {
                 "discipline": args.discipline,
@@ -7,9 +7,24 @@ transitioning to the next stage in the paper writing workflow.
 """
 
 from dataclasses import dataclass
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional
 import sys
 
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 
 @dataclass
 class ValidationResult:
@@ -41,6 +56,117 @@ class StageValidator:
 
     WRITING_REQUIRED = ["sections", "drafts"]
 
+    # Manuscript sections in reporting order, and as a set for the check.
+    _SECTION_ORDER = ("abstract", "introduction", "method", "experiments", "conclusion")
+    _REQUIRED_SECTIONS = frozenset(_SECTION_ORDER)
+
+    _STAGES_ORDER = ("literature_review", "hypothesis", "code", "experiment", "writing")
+    _STAGE_INDEX = {name: i for i, name in enumerate(_STAGES_ORDER)}
+
+    _NON_EMPTY = {
+        "anyOf": [
+            {"type": "string", "minLength": 1},
+            {"type": "object", "minProperties": 1},
+            {"type": "array", "minItems": 1},
+        ]
+    }
+
+    # JSON Schemas describing a stage that passes every hand-written check.
+    # They are sufficient, not necessary: data matching a schema is valid,
+    # anything else is re-checked by the detailed rules to report issues.
+    _SCHEMAS: Dict[str, Dict[str, Any]] = {
+        "literature_review": {
+            "type": "object",
+            "required": LITERATURE_REVIEW_REQUIRED,
+            "properties": {
+                "research_gap": {"type": "string", "minLength": 50},
+                "key_papers": {"type": "array", "minItems": 5},
+                "summary": _NON_EMPTY,
+            },
+        },
+        "hypothesis": {
+            "type": "object",
+            "required": HYPOTHESIS_REQUIRED,
+            "properties": {
+                "hypotheses": {"type": "array", "minItems": 1},
+                "experiment_designs": {"type": "array", "minItems": 1},
+                "feasibility": {"type": "object", "required": ["data", "method"]},
+            },
+        },
+        "code": {
+            "type": "object",
+            "required": CODE_REQUIRED,
+            "properties": {
+                "repo_url": {"type": "string", "minLength": 1},
+                "config": {
+                    "anyOf": [
+                        {"type": "string", "minLength": 1},
+                        {"type": "object", "minProperties": 1},
+                    ]
+                },
+            },
+        },
+        "experiment": {
+            "type": "object",
+            "required": EXPERIMENT_REQUIRED,
+            "properties": {
+                "results": {"type": "object", "minProperties": 1},
+                "tables": {"type": "array", "minItems": 1},
+                "analysis": _NON_EMPTY,
+            },
+        },
+        "writing": {
+            "type": "object",
+            "required": WRITING_REQUIRED,
+            "properties": {
+                "sections": {
+                    "type": "object",
+                    "required": list(_SECTION_ORDER),
+                    "properties": {
+                        "abstract": _NON_EMPTY,
+                        "introduction": _NON_EMPTY,
+                        "method": _NON_EMPTY,
+                        "experiments": _NON_EMPTY,
+                        "conclusion": _NON_EMPTY,
+                    },
+                },
+                "drafts": {"type": "array", "minItems": 1},
+            },
+        },
+    }
+
+    _compiled: Optional[Dict[str, Callable[[Any], Any]]] = None
+
+    @classmethod
+    def _schema_validators(cls) -> Dict[str, Callable[[Any], Any]]:
+        """Compile the stage schemas once per process and reuse them."""
+        if cls._compiled is None:
+            cls._compiled = (
+                {}
+                if fastjsonschema is None
+                else {
+                    stage: fastjsonschema.compile(schema)
+                    for stage, schema in cls._SCHEMAS.items()
+                }
+            )
+        return cls._compiled
+
+    def _passes_schema(self, stage: str, stage_data: Any) -> bool:
+        """Return True if stage_data matches the compiled schema for stage."""
+        validate = self._schema_validators().get(stage)
+        if validate is None:
+            return False
+        try:
+            validate(stage_data)
+        except fastjsonschema.JsonSchemaException:
+            return False
+        return True
+
+    @staticmethod
+    def _stage_data(context: Dict[str, Any], stage: str) -> Dict[str, Any]:
+        """Return a stage's data from the context, or an empty dict."""
+        return (context.get("stages") or {}).get(stage) or {}
+
     def validate_literature_review(self, context: Dict[str, Any]) -> ValidationResult:
         """Validate literature review stage completion.
 
@@ -55,7 +181,16 @@ class StageValidator:
         Returns:
             ValidationResult with validation status and any issues
         """
-        stage_data = context.get("stages", {}).get("literature_review", {})
+        stage_data = self._stage_data(context, "literature_review")
+        return self._validate_literature_review(stage_data)
+
+    def _validate_literature_review(
+        self, stage_data: Dict[str, Any]
+    ) -> ValidationResult:
+        """Validate already-extracted literature review stage data."""
+        if self._passes_schema("literature_review", stage_data):
+            return ValidationResult(valid=True, missing_fields=[], errors=[])
+
         missing = []
         errors = []
 
@@ -93,7 +228,13 @@ class StageValidator:
         Returns:
             ValidationResult with validation status and any issues
         """
-        stage_data = context.get("stages", {}).get("hypothesis", {})
+        return self._validate_hypothesis(self._stage_data(context, "hypothesis"))
+
+    def _validate_hypothesis(self, stage_data: Dict[str, Any]) -> ValidationResult:
+        """Validate already-extracted hypothesis stage data."""
+        if self._passes_schema("hypothesis", stage_data):
+            return ValidationResult(valid=True, missing_fields=[], errors=[])
+
         missing = []
         errors = []
 
@@ -145,7 +286,13 @@ class StageValidator:
         Returns:
             ValidationResult with validation status and any issues
         """
-        stage_data = context.get("stages", {}).get("code", {})
+        return self._validate_code(self._stage_data(context, "code"))
+
+    def _validate_code(self, stage_data: Dict[str, Any]) -> ValidationResult:
+        """Validate already-extracted code stage data."""
+        if self._passes_schema("code", stage_data):
+            return ValidationResult(valid=True, missing_fields=[], errors=[])
+
         missing = []
         errors = []
 
@@ -181,7 +328,13 @@ class StageValidator:
         Returns:
             ValidationResult with validation status and any issues
         """
-        stage_data = context.get("stages", {}).get("experiment", {})
+        return self._validate_experiment(self._stage_data(context, "experiment"))
+
+    def _validate_experiment(self, stage_data: Dict[str, Any]) -> ValidationResult:
+        """Validate already-extracted experiment stage data."""
+        if self._passes_schema("experiment", stage_data):
+            return ValidationResult(valid=True, missing_fields=[], errors=[])
+
         missing = []
         errors = []
 
@@ -226,7 +379,13 @@ class StageValidator:
         Returns:
             ValidationResult with validation status and any issues
         """
-        stage_data = context.get("stages", {}).get("writing", {})
+        return self._validate_writing(self._stage_data(context, "writing"))
+
+    def _validate_writing(self, stage_data: Dict[str, Any]) -> ValidationResult:
+        """Validate already-extracted writing stage data."""
+        if self._passes_schema("writing", stage_data):
+            return ValidationResult(valid=True, missing_fields=[], errors=[])
+
         missing = []
         errors = []
 
@@ -242,16 +401,17 @@ class StageValidator:
         if not isinstance(drafts, list):
             errors.append("drafts must be a list")
 
-        required_sections = [
-            "abstract",
-            "introduction",
-            "method",
-            "experiments",
-            "conclusion",
-        ]
-        for section in required_sections:
-            if section not in sections or not sections[section]:
-                missing.append(f"section.{section}")
+        if isinstance(sections, dict):
+            present = {name for name, content in sections.items() if content}
+        else:
+            present = set()
+        missing_sections = self._REQUIRED_SECTIONS - present
+        if missing_sections:
+            missing.extend(
+                f"section.{section}"
+                for section in self._SECTION_ORDER
+                if section in missing_sections
+            )
 
         return ValidationResult(
             valid=len(missing) == 0 and len(errors) == 0,
@@ -278,24 +438,16 @@ class StageValidator:
             ValidationResult indicating if transition is valid
         """
         errors = []
-        stages_order = [
-            "literature_review",
-            "hypothesis",
-            "code",
-            "experiment",
-            "writing",
-        ]
+        from_idx = self._STAGE_INDEX.get(from_stage)
+        to_idx = self._STAGE_INDEX.get(to_stage)
 
-        if from_stage not in stages_order:
+        if from_idx is None:
             errors.append(f"Invalid source stage: {from_stage}")
 
-        if to_stage not in stages_order:
+        if to_idx is None:
             errors.append(f"Invalid destination stage: {to_stage}")
 
-        if from_stage in stages_order and to_stage in stages_order:
-            from_idx = stages_order.index(from_stage)
-            to_idx = stages_order.index(to_stage)
-
+        if from_idx is not None and to_idx is not None:
             if to_idx <= from_idx:
                 errors.append(
                     f"Cannot transition backward from {from_stage} to {to_stage}"
@@ -304,7 +456,6 @@ class StageValidator:
             if to_idx > from_idx + 1:
                 errors.append(f"Cannot skip stages from {from_stage} to {to_stage}")
 
-        from_idx = stages_order.index(from_stage)
         source_valid = self.is_stage_complete(context, from_stage)
 
         if not source_valid:
@@ -324,18 +475,10 @@ class StageValidator:
         Returns:
             True if stage status is 'completed', False otherwise
         """
-        stages_order = [
-            "literature_review",
-            "hypothesis",
-            "code",
-            "experiment",
-            "writing",
-        ]
-        if stage not in stages_order:
+        if stage not in self._STAGE_INDEX:
             return False
 
-        stage_data = context.get("stages", {}).get(stage, {})
-        return stage_data.get("status") == "completed"
+        return self._stage_data(context, stage).get("status") == "completed"
 
     def validate_all(self, context: Dict[str, Any]) -> Dict[str, ValidationResult]:
         """Validate all stages in the workflow.
@@ -346,16 +489,48 @@ class StageValidator:
         Returns:
             Dictionary mapping stage names to ValidationResult
         """
+        stages = context.get("stages") or {}
         results = {
-            "literature_review": self.validate_literature_review(context),
-            "hypothesis": self.validate_hypothesis(context),
-            "code": self.validate_code(context),
-            "experiment": self.validate_experiment(context),
-            "writing": self.validate_writing(context),
+            "literature_review": self._validate_literature_review(
+                stages.get("literature_review") or {}
+            ),
+            "hypothesis": self._validate_hypothesis(stages.get("hypothesis") or {}),
+            "code": self._validate_code(stages.get("code") or {}),
+            "experiment": self._validate_experiment(stages.get("experiment") or {}),
+            "writing": self._validate_writing(stages.get("writing") or {}),
         }
         return results
 
 
+def load_context(context_file: str, stage: Optional[str] = None) -> Dict[str, Any]:
+    """Load a context file for validation.
+
+    When a single stage is requested and ijson is installed, only that stage
+    is decoded and the parser stops as soon as it has been read. Otherwise the
+    whole file is parsed, with orjson when available.
+
+    Args:
+        context_file: Path to .paper_context.json
+        stage: Stage to extract, or None to load the full context
+
+    Returns:
+        Context dictionary (containing only the requested stage if given)
+    """
+    if stage is not None and ijson is not None:
+        with open(context_file, "rb") as f:
+            stage_data = next(ijson.items(f, f"stages.{stage}", use_float=True), {})
+        return {"stages": {stage: stage_data}}
+
+    if orjson is not None:
+        with open(context_file, "rb") as f:
+            return orjson.loads(f.read())
+
+    import json
+
+    with open(context_file, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
 def main():
     """CLI interface for stage validator."""
     import argparse
@@ -387,8 +562,9 @@ def main():
     try:
         import json
 
-        with open(args.context_file, "r", encoding="utf-8") as f:
-            context = json.load(f)
+        context = load_context(
+            args.context_file, None if args.stage == "all" else args.stage
+        )
 
         validator = StageValidator()
 
@@ -447,7 +623,10 @@ def main():
         print(f"Error: Invalid JSON in context file: {e}", file=sys.stderr)
         sys.exit(1)
     except Exception as e:
-        print(f"Error: {e}", file=sys.stderr)
+        if ijson is not None and isinstance(e, ijson.JSONError):
+            print(f"Error: Invalid JSON in context file: {e}", file=sys.stderr)
+        else:
+            print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
 
 
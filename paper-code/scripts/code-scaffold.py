@@ -61,9 +61,18 @@ def create_template(template_name: str, output_dir: str):
 
     for filename, description in template["files"].items():
         filepath = output_path / filename
-        if not filepath.exists():
-            filepath.write_text(f"# {description}\n# TODO: Implement\n")
-            print(f"Created: {filepath}")
+        payload = f"# {description}\n# TODO: Implement\n".encode()
+        # O_EXCL makes "create only if missing" a single atomic open instead of
+        # an exists() check that can race with another writer.
+        try:
+            fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            continue
+        try:
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
+        print(f"Created: {filepath}")
 
     print(f"\nTemplate '{template_name}' created in {output_dir}")
 
@@ -6,12 +6,117 @@ Checks code quality for academic projects including linting,
 type checking, import validation, and best practices.
 """
 
+import argparse
+import ast
+import configparser
+import hashlib
+import importlib.util
+import json
+import os
+import re
 import subprocess
 import sys
-from typing import List, Dict, Any, Tuple
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List, Dict, Any, Iterator, Optional, Tuple, Union
 from pathlib import Path
 
 
+# Directories that never hold project sources; flake8 and black skip them too.
+_SKIP_DIRS = frozenset({"__pycache__", "build", "dist", "node_modules"})
+
+
+@dataclass
+class _SourceFile:
+    """A project source file, read and parsed once for every checker."""
+
+    path: Path
+    text: str
+    tree: Optional[ast.Module]
+    syntax_error: Optional[SyntaxError] = None
+
+
+# Files flake8 reads a [flake8] section from, in its own lookup order.
+_FLAKE8_CONFIG_FILES = ("setup.cfg", "tox.ini", ".flake8")
+
+
+def _find_flake8_config(start: Path) -> Optional[Path]:
+    """Return the flake8 config file that applies to start, or None.
+
+    Follows flake8's own search (each directory up to the home directory),
+    but from the project rather than the current working directory, so
+    results do not depend on where the validator is run from.
+    """
+    home = Path.home()
+    for directory in (start, *start.parents):
+        for name in _FLAKE8_CONFIG_FILES:
+            parser = configparser.RawConfigParser()
+            try:
+                parser.read(directory / name, encoding="utf-8")
+            except (configparser.Error, UnicodeDecodeError):
+                continue
+            if parser.has_section("flake8") or parser.has_section(
+                "flake8:local-plugins"
+            ):
+                return directory / name
+        if directory == home:
+            break
+    return None
+
+
+def _find_pyproject(start: Path) -> Optional[Path]:
+    """Return the nearest pyproject.toml at or above start, or None."""
+    for directory in (start, *start.parents):
+        candidate = directory / "pyproject.toml"
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def _digest(data: bytes) -> str:
+    """Return a short blake2b digest of a file's contents."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _iter_python_files(root: Path) -> Iterator[Tuple[Path, os.stat_result]]:
+    """Yield (path, stat) for each .py file under root in a single scandir walk.
+
+    Hidden directories (.git, .venv, .tox, ...) and build output are skipped.
+    """
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name[0] != "." and entry.name not in _SKIP_DIRS:
+                            stack.append(Path(entry.path))
+                    elif entry.name.endswith(".py") and entry.is_file():
+                        yield Path(entry.path), entry.stat()
+        except OSError:
+            continue
+
+
+def _iter_import_names(tree: ast.Module) -> Iterator[str]:
+    """Yield the dotted names imported at the top level of a module."""
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                yield alias.name
+        elif isinstance(node, ast.ImportFrom):
+            module = node.module or ""
+            for alias in node.names:
+                yield f"{module}.{alias.name}"
+
+
+def _as_args(paths: Union[str, Path, List[Path]]) -> List[str]:
+    """Turn a single path or a list of paths into command-line arguments."""
+    if isinstance(paths, (list, tuple)):
+        return [str(p) for p in paths]
+    return [str(paths)]
+
+
 class CodeValidator:
     """Validates code quality against academic standards."""
 
@@ -35,17 +140,244 @@ class CodeValidator:
 
     AVAILABLE_CHECKERS = ["flake8", "black", "mypy"]
 
-    def __init__(self, project_path: str = "."):
+    CACHE_FILE = ".codevalidator_cache.json"
+
+    # Report lines of each tool. Output is scanned as bytes in one finditer
+    # pass, so only the matching lines are ever decoded.
+    _FLAKE8_RE = re.compile(
+        rb"^(?P<path>[^:\n]+):(?P<line>\d+):(?P<col>\d+):\s+"
+        rb"(?P<code>[A-Z]+\d+)\s+(?P<msg>[^\r\n]*)",
+        re.MULTILINE,
+    )
+    _BLACK_RE = re.compile(rb"^would reformat\s+(?P<path>[^\r\n]+)", re.MULTILINE)
+    _MYPY_RE = re.compile(
+        rb"^(?P<path>[^:\n]+):(?P<line>\d+):(?:\d+:)?\s*"
+        rb"(?P<kind>error|warning|note):\s*(?P<msg>[^\r\n]*)",
+        re.MULTILINE,
+    )
+
+    # Tools whose results can be cached per source file. flake8 and black judge
+    # each file on its own; mypy follows imports, so it is only skipped when no
+    # file in the project has changed.
+    CACHEABLE_CHECKERS = {"flake8": True, "black": True, "mypy": False}
+
+    _RESULT_LIST_KEY = {
+        "flake8": "warnings",
+        "black": "formatting_issues",
+        "mypy": "warnings",
+    }
+
+    # Checkers that can run in-process on sources the validator has already
+    # read and parsed, and the modules that path needs.
+    _IN_PROCESS_MODULES = {
+        "flake8": ("flake8", "pycodestyle", "pyflakes"),
+        "black": ("black",),
+    }
+
+    # [tool.black] options the in-process check can express as a black.Mode.
+    # Any other option (such as include/exclude patterns) leaves black to its
+    # command line, which applies it exactly.
+    _BLACK_MODE_OPTIONS = frozenset({
+        "line_length",
+        "target_version",
+        "skip_string_normalization",
+        "skip_magic_trailing_comma",
+        "preview",
+        "skip_source_first_line",
+    })
+
+    def __init__(self, project_path: str = ".", use_dmypy: bool = False):
         """Initialize code validator.
 
         Args:
             project_path: Root directory of project
+            use_dmypy: Run mypy through its daemon, which is left running and
+                writes .dmypy.json to the working directory
         """
         self.project_path = Path(project_path).resolve()
 
         if not self.project_path.exists():
             raise FileNotFoundError(f"Project path does not exist: {project_path}")
 
+        self._use_dmypy = use_dmypy
+        self._cache_path = self.project_path / self.CACHE_FILE
+        self._cache = self._load_cache()
+        self._tool_versions: Dict[str, Optional[str]] = {}
+        self._in_process: Dict[str, bool] = {}
+        self._flake8_config = _find_flake8_config(self.project_path)
+        self._black_mode = None
+
+    def _load_cache(self) -> Dict[str, Any]:
+        """Load the on-disk result cache, ignoring a missing or corrupt file."""
+        try:
+            with open(self._cache_path, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return cache if isinstance(cache, dict) else {}
+
+    def _save_cache(self) -> None:
+        """Write the result cache atomically next to the project sources."""
+        try:
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self.project_path, prefix=".codevalidator_", suffix=".tmp"
+            )
+        except OSError:
+            return
+
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self._cache, f)
+            os.replace(tmp_path, self._cache_path)
+        except OSError:
+            Path(tmp_path).unlink(missing_ok=True)
+
+    def _tool_version(self, tool: str) -> Optional[str]:
+        """Return the installed version of a checker tool, or None if unknown."""
+        if tool not in self._tool_versions:
+            from importlib import metadata
+
+            try:
+                version = metadata.version(tool)
+            except metadata.PackageNotFoundError:
+                try:
+                    result = subprocess.run(
+                        [tool, "--version"],
+                        capture_output=True,
+                        text=True,
+                        timeout=30
+                    )
+                    version = result.stdout.strip() or None
+                except (OSError, subprocess.TimeoutExpired):
+                    version = None
+            self._tool_versions[tool] = version
+        return self._tool_versions[tool]
+
+    def _checker_version(self, checker: str) -> Optional[str]:
+        """Return the version string results of a checker are cached under.
+
+        It includes a digest of the checker's config file, so editing the
+        project's lint settings invalidates earlier passes.
+        """
+        if not self._runs_in_process(checker):
+            version = self._tool_version(checker)
+        else:
+            versions = [
+                self._tool_version(m) for m in self._IN_PROCESS_MODULES[checker]
+            ]
+            if None in versions:
+                return None
+            version = "in-process " + " ".join(versions)
+
+        config = {"flake8": self._flake8_config}.get(checker)
+        if checker == "black":
+            config = _find_pyproject(self.project_path)
+        if version is None or config is None:
+            return version
+        try:
+            return f"{version} config {_digest(config.read_bytes())}"
+        except OSError:
+            return None
+
+    def _runs_in_process(self, checker: str) -> bool:
+        """Whether a checker can run in-process with the project's settings."""
+        if checker not in self._in_process:
+            modules = self._IN_PROCESS_MODULES.get(checker, ())
+            in_process = bool(modules) and all(
+                importlib.util.find_spec(m) is not None for m in modules
+            )
+            if in_process and checker == "black":
+                in_process = self._load_black_mode()
+            self._in_process[checker] = in_process
+        return self._in_process[checker]
+
+    def _load_black_mode(self) -> bool:
+        """Build the black.Mode for the project's [tool.black] settings.
+
+        Returns:
+            False if the settings cannot be expressed as a Mode, in which
+            case black has to run through its command line
+        """
+        import black
+
+        options: Dict[str, Any] = {}
+        pyproject = black.find_pyproject_toml((str(self.project_path),))
+        if pyproject:
+            try:
+                options = black.parse_pyproject_toml(pyproject)
+            except (OSError, ValueError):
+                return False
+        if not self._BLACK_MODE_OPTIONS.issuperset(options):
+            return False
+
+        target_versions = options.get("target_version", [])
+        if isinstance(target_versions, str):
+            target_versions = [target_versions]
+        try:
+            self._black_mode = black.Mode(
+                target_versions={
+                    black.TargetVersion[v.upper()] for v in target_versions
+                },
+                line_length=options.get("line_length", black.DEFAULT_LINE_LENGTH),
+                string_normalization=not options.get(
+                    "skip_string_normalization", False
+                ),
+                magic_trailing_comma=not options.get(
+                    "skip_magic_trailing_comma", False
+                ),
+                preview=options.get("preview", False),
+                skip_source_first_line=options.get("skip_source_first_line", False),
+            )
+        except (KeyError, TypeError):
+            return False
+        return True
+
+    def _flake8_config_args(self) -> List[str]:
+        """Point flake8 at the project's config, or at none if it has none."""
+        if self._flake8_config is None:
+            return ["--isolated"]
+        return ["--config", str(self._flake8_config)]
+
+    def _fingerprint_sources(
+        self,
+    ) -> Tuple[Dict[str, List[Any]], Dict[str, bytes]]:
+        """Map each project .py file to [mtime_ns, size, digest].
+
+        Files whose mtime and size match the cache reuse the cached digest,
+        so only touched files are read and re-hashed.
+
+        Returns:
+            The fingerprints, and the raw contents of the files that were read
+            so the checkers can reuse them instead of reading them again
+        """
+        known = self._cache.get("files", {})
+        files = {}
+        contents = {}
+        for path, st in _iter_python_files(self.project_path):
+            rel = path.relative_to(self.project_path).as_posix()
+            prev = known.get(rel)
+            if prev and prev[0] == st.st_mtime_ns and prev[1] == st.st_size:
+                files[rel] = prev
+                continue
+            try:
+                data = path.read_bytes()
+            except OSError:
+                continue
+            contents[rel] = data
+            files[rel] = [st.st_mtime_ns, st.st_size, _digest(data)]
+        return files, contents
+
+    def _load_source(self, rel: str, data: Optional[bytes] = None) -> _SourceFile:
+        """Decode and parse one project file, reading it only if not given."""
+        path = self.project_path / rel
+        if data is None:
+            data = path.read_bytes()
+        text = data.decode("utf-8", errors="replace")
+        try:
+            return _SourceFile(path, text, ast.parse(text, filename=str(path)))
+        except SyntaxError as e:
+            return _SourceFile(path, text, None, e)
+
     def check_linting(self, file_path: str) -> Dict[str, Any]:
         """Check code style with flake8.
 
@@ -64,30 +396,23 @@ class CodeValidator:
 
         try:
             result = subprocess.run(
-                ["flake8", file_path],
+                ["flake8", *self._flake8_config_args(), *_as_args(file_path)],
                 capture_output=True,
-                text=True,
                 timeout=30
             )
 
-            if result.returncode == 0:
-                output = result.stdout.strip()
-                errors = []
-                warnings = []
-
-                for line in output.split('\n'):
-                    if line.strip() and not line.startswith('  '):
-                        errors.append(line.strip())
-                    elif line.startswith('C90'):
-                        errors.append(line.strip())
-                    elif ': undefined' in line.lower() and 'import' in line.lower():
-                        errors.append(line.strip())
+            # flake8 exits 1 when it found problems and >1 when it failed.
+            if result.returncode in (0, 1):
+                errors = [
+                    m.group(0).decode("utf-8", errors="replace")
+                    for m in self._FLAKE8_RE.finditer(result.stdout)
+                ]
 
                 return {
                     "valid": len(errors) == 0,
                     "skipped": False,
                     "errors": errors,
-                    "warnings": warnings
+                    "warnings": []
                 }
             else:
                 return {
@@ -131,19 +456,18 @@ class CodeValidator:
 
         try:
             result = subprocess.run(
-                ["black", "--check", file_path],
+                ["black", "--check", *_as_args(file_path)],
                 capture_output=True,
-                text=True,
                 timeout=30
             )
 
-            if result.returncode == 0:
-                output = result.stdout.strip()
-                formatting_issues = []
-
-                for line in output.split('\n'):
-                    if line.startswith('would reformat'):
-                        formatting_issues.append(line.strip())
+            # black --check exits 1 when files would be reformatted and reports
+            # them on stderr; 123 means it could not parse something.
+            if result.returncode in (0, 1):
+                formatting_issues = [
+                    m.group(0).decode("utf-8", errors="replace")
+                    for m in self._BLACK_RE.finditer(result.stderr)
+                ]
 
                 return {
                     "valid": len(formatting_issues) == 0,
@@ -152,7 +476,7 @@ class CodeValidator:
                     "formatting_issues": formatting_issues
                 }
             else:
-                error_msg = result.stderr.strip() if result.stderr else ""
+                error_msg = result.stderr.decode("utf-8", errors="replace").strip()
                 return {
                     "valid": False,
                     "skipped": True,
@@ -192,23 +516,20 @@ class CodeValidator:
             }
 
         try:
-            result = subprocess.run(
-                ["mypy", file_path],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+            result = self._run_mypy(file_path)
 
-            if result.returncode == 0:
-                output = result.stdout.strip()
+            # mypy exits 1 when it reports type errors and 2 on a crash or
+            # bad invocation.
+            if result.returncode in (0, 1):
                 errors = []
                 warnings = []
 
-                for line in output.split('\n'):
-                    if ': ' in line and 'note:' in line.lower():
-                        errors.append(line.strip())
-                    elif 'error:' in line.lower() or 'warning:' in line.lower():
-                        errors.append(line.strip())
+                for m in self._MYPY_RE.finditer(result.stdout):
+                    line = m.group(0).decode("utf-8", errors="replace")
+                    if m.group("kind") == b"error":
+                        errors.append(line)
+                    else:
+                        warnings.append(line)
 
                 return {
                     "valid": len(errors) == 0,
@@ -217,7 +538,7 @@ class CodeValidator:
                     "warnings": warnings
                 }
             else:
-                error_msg = result.stderr.strip() if result.stderr else ""
+                error_msg = result.stderr.decode("utf-8", errors="replace").strip()
                 return {
                     "valid": False,
                     "skipped": True,
@@ -240,6 +561,29 @@ class CodeValidator:
                 "warnings": []
             }
 
+    def _run_mypy(self, file_path: str) -> subprocess.CompletedProcess:
+        """Run mypy, through its daemon when enabled and installed.
+
+        ``dmypy run`` starts the daemon on first use and keeps typeshed and the
+        module cache warm, so later validations skip mypy's cold start. Without
+        the daemon, each call is a one-shot mypy run.
+        """
+        if self._use_dmypy:
+            try:
+                return subprocess.run(
+                    ["dmypy", "run", "--", *_as_args(file_path)],
+                    capture_output=True,
+                    timeout=30
+                )
+            except FileNotFoundError:
+                self._use_dmypy = False
+
+        return subprocess.run(
+            ["mypy", *_as_args(file_path)],
+            capture_output=True,
+            timeout=30
+        )
+
     def check_imports(self, file_path: str) -> Dict[str, Any]:
         """Check if all imports are available.
 
@@ -253,22 +597,13 @@ class CodeValidator:
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
 
-            imports = []
-
-            import ast
-            tree = ast.parse(content)
-
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Import):
-                    imports.append(node.module)
-                    for alias in node.names:
-                        imports.append(f"{node.module}.{alias}")
+            imports = dict.fromkeys(_iter_import_names(ast.parse(content)))
 
             return {
                 "valid": True,
                 "skipped": False,
                 "errors": [],
-                "missing_imports": list(set(imports))
+                "missing_imports": list(imports)
             }
 
         except SyntaxError as e:
@@ -279,6 +614,95 @@ class CodeValidator:
                 "missing_imports": []
             }
 
+    def _check_imports_sources(self, sources: List[_SourceFile]) -> Dict[str, Any]:
+        """Run the import check over already-parsed project files."""
+        imports: Dict[str, None] = {}
+        errors = []
+        for source in sources:
+            if source.tree is None:
+                errors.append(f"Syntax error: {source.syntax_error}")
+            else:
+                imports.update(dict.fromkeys(_iter_import_names(source.tree)))
+
+        return {
+            "valid": not errors,
+            "skipped": False,
+            "errors": errors,
+            "missing_imports": list(imports)
+        }
+
+    def _lint_sources(self, sources: List[_SourceFile]) -> Dict[str, Any]:
+        """In-process counterpart of ``check_linting``.
+
+        Drives flake8's own application rather than its checkers one by one,
+        so the project's [flake8] options, ``# noqa`` comments and installed
+        plugins apply exactly as they do on the command line.
+        """
+        from flake8.api.legacy import StyleGuide
+        from flake8.formatting.base import BaseFormatter
+        from flake8.main.application import Application
+        from flake8.options.parse_args import parse_args
+
+        errors = []
+
+        class _CollectingFormatter(BaseFormatter):
+            def handle(self, error):
+                errors.append(
+                    f"{error.filename}:{error.line_number}:{error.column_number}: "
+                    f"{error.code} {error.text}"
+                )
+
+        # One process: the validator already runs checkers on threads.
+        app = Application()
+        app.plugins, app.options = parse_args(
+            ["--jobs", "1", *self._flake8_config_args()]
+        )
+        app.formatter = _CollectingFormatter(app.options)
+        app.make_guide()
+        app.make_file_checker_manager([])
+        StyleGuide(app).check_files([str(source.path) for source in sources])
+
+        return {
+            "valid": not errors,
+            "skipped": False,
+            "errors": errors,
+            "warnings": []
+        }
+
+    def _check_file_black(self, source: _SourceFile) -> Optional[str]:
+        """Return black's "would reformat" line for a loaded file, or None."""
+        import black
+
+        try:
+            black.format_file_contents(
+                source.text, fast=True, mode=self._black_mode
+            )
+        except black.NothingChanged:
+            return None
+        return f"would reformat {source.path}"
+
+    def _black_sources(self, sources: List[_SourceFile]) -> Dict[str, Any]:
+        """In-process counterpart of ``check_black_formatting``."""
+        import black
+
+        errors = []
+        formatting_issues = []
+        for source in sources:
+            try:
+                issue = self._check_file_black(source)
+            except black.InvalidInput as e:
+                errors.append(f"cannot format {source.path}: {e}")
+                continue
+            if issue:
+                formatting_issues.append(issue)
+
+        return {
+            "valid": not errors and not formatting_issues,
+            "skipped": False,
+            "errors": errors,
+            "formatting_issues": formatting_issues
+        }
+
     def validate_project(self, checkers: List[str] = None) -> Dict[str, Any]:
         """Run selected quality checks on the project.
 
@@ -297,22 +721,101 @@ class CodeValidator:
                 "summary": "Project path does not exist"
             }
 
-        results = {}
-
         if checkers is None:
             checkers = self.AVAILABLE_CHECKERS
 
-        for checker in checkers:
-            if checker == "flake8":
-                results["flake8"] = self.check_linting(self.project_path)
-            elif checker == "black":
-                results["black"] = self.check_black_formatting(self.project_path)
-            elif checker == "mypy":
-                results["mypy"] = self.check_type_hints(self.project_path)
-            elif checker == "imports":
-                results["imports"] = self.check_imports(self.project_path)
+        runners = {
+            "flake8": self.check_linting,
+            "black": self.check_black_formatting,
+            "mypy": self.check_type_hints,
+            "imports": self.check_imports,
+        }
+        selected = [checker for checker in checkers if checker in runners]
+        if not selected:
+            return {}
 
-        return results
+        files, contents = self._fingerprint_sources()
+        passed = self._cache.setdefault("passed", {})
+        results = {}
+        targets: Dict[str, Optional[List[str]]] = {}
+        versions = {}
+
+        for checker in selected:
+            if checker not in self.CACHEABLE_CHECKERS:
+                targets[checker] = None
+                continue
+
+            versions[checker] = version = self._checker_version(checker)
+            previous = passed.get(checker, {})
+            if version is None or previous.get("version") != version:
+                changed = list(files)
+            else:
+                passed_files = previous.get("files", {})
+                changed = [
+                    rel for rel, fp in files.items() if passed_files.get(rel) != fp[2]
+                ]
+
+            if not changed:
+                results[checker] = {
+                    "valid": True,
+                    "skipped": False,
+                    "cached": True,
+                    "errors": [],
+                    self._RESULT_LIST_KEY[checker]: [],
+                }
+            elif self.CACHEABLE_CHECKERS[checker] and version is not None:
+                targets[checker] = changed
+            else:
+                targets[checker] = None
+
+        # Read and parse each file once and hand the same source to every
+        # checker that can take it in-process, instead of letting each tool
+        # walk, read and parse the whole tree again on its own.
+        source_runners = {"imports": self._check_imports_sources}
+        if self._runs_in_process("flake8"):
+            source_runners["flake8"] = self._lint_sources
+        if self._runs_in_process("black"):
+            source_runners["black"] = self._black_sources
+
+        sources: Dict[str, _SourceFile] = {}
+        for checker, target in targets.items():
+            if checker in source_runners:
+                for rel in files if target is None else target:
+                    if rel not in sources:
+                        sources[rel] = self._load_source(rel, contents.get(rel))
+
+        def run(checker: str, target: Optional[List[str]]) -> Dict[str, Any]:
+            if checker in source_runners:
+                rels = files if target is None else target
+                return source_runners[checker]([sources[rel] for rel in rels])
+            if target is None:
+                return runners[checker](self.project_path)
+            return runners[checker]([self.project_path / rel for rel in target])
+
+        # Subprocess checkers mostly wait on their tool, so running them on
+        # threads overlaps the tool runs instead of paying for them in sequence.
+        if targets:
+            with ThreadPoolExecutor(max_workers=len(targets)) as executor:
+                futures = {
+                    checker: executor.submit(run, checker, target)
+                    for checker, target in targets.items()
+                }
+            for checker, future in futures.items():
+                results[checker] = future.result()
+
+        cache_dirty = self._cache.get("files") != files
+        self._cache["files"] = files
+        for checker, version in versions.items():
+            if checker in targets and version is not None and results[checker]["valid"]:
+                passed[checker] = {
+                    "version": version,
+                    "files": {rel: fp[2] for rel, fp in files.items()},
+                }
+                cache_dirty = True
+        if cache_dirty:
+            self._save_cache()
+
+        return {checker: results[checker] for checker in selected}
 
 
 def main():
@@ -336,13 +839,16 @@ def main():
         action="store_true",
         help="Pretty print results"
     )
+    parser.add_argument(
+        "--dmypy",
+        action="store_true",
+        help="Run mypy through the dmypy daemon, which stays running for faster "
+        "later runs and writes .dmypy.json to the current directory"
+    )
 
     args = parser.parse_args()
 
-    validator = CodeValidator(args.project_path)
-
-    if args.checkers is None:
-        checkers = validator.AVAILABLE_CHECKERS
+    validator = CodeValidator(args.project_path, use_dmypy=args.dmypy)
 
     results = validator.validate_project(args.checkers)
 
@@ -5,55 +5,259 @@ Execute experiments with grid search, random search, or single run.
 """
 
 import argparse
+import contextlib
+import importlib.util
 import json
+import os
 import subprocess
 import itertools
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Callable, Dict, List, Any, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def run_experiment(config: Dict[str, Any], log_dir: str) -> Dict:
-    """Run a single experiment with given config."""
+# GPU ids claimed by this pool worker process, see run_trials.
+_worker_gpus: Optional[List[str]] = None
+
+# train.py run() entry points already imported by this process, by path.
+_trainers: Dict[Path, Callable[[Dict[str, Any]], Any]] = {}
+
+
+def _claim_gpu_slot(slot_queue) -> None:
+    """Pool initializer: pin this worker to one group of GPUs."""
+    global _worker_gpus
+    _worker_gpus = slot_queue.get()
+    # Set before train.py (and its framework) is imported in this worker.
+    os.environ["CUDA_VISIBLE_DEVICES"] = ",".join(_worker_gpus)
+
+
+def _load_trainer(workdir: Path) -> Callable[[Dict[str, Any]], Any]:
+    """Import workdir/train.py once per process and return its run()."""
+    script = (workdir / "train.py").resolve()
+    if script not in _trainers:
+        spec = importlib.util.spec_from_file_location("train", script)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        if not callable(getattr(module, "run", None)):
+            raise AttributeError(f"{script} does not define run(config)")
+        _trainers[script] = module.run
+    return _trainers[script]
+
+
+def _run_in_process(config: Dict[str, Any], log_path: Path) -> Dict:
+    """Run train.run(config) in this process, logging output to files.
+
+    The trainer module stays imported between trials, so only the first
+    trial in each process pays for interpreter-level imports.
+    """
+    stdout_path = log_path / "stdout.log"
+    stderr_path = log_path / "stderr.log"
+    workdir = log_path.parent.resolve()
+    previous_dir = os.getcwd()
+    with open(stdout_path, "w") as stdout, open(stderr_path, "w") as stderr:
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                train = _load_trainer(workdir)
+                os.chdir(workdir)
+                metrics = train(config)
+                returncode = 0
+            except Exception:
+                traceback.print_exc()
+                metrics = None
+                returncode = 1
+            finally:
+                os.chdir(previous_dir)
+
+    result = {
+        "config": config,
+        "returncode": returncode,
+        "stdout_path": str(stdout_path),
+        "stderr_path": str(stderr_path),
+    }
+    if metrics is not None:
+        result["metrics"] = metrics
+    return result
+
+
+def run_experiment(
+    config: Dict[str, Any],
+    log_dir: str,
+    gpus: Optional[List[str]] = None,
+    in_process: bool = False,
+) -> Dict:
+    """Run a single experiment with given config.
+
+    Args:
+        config: Hyperparameters passed to train.py as --key value flags
+        log_dir: Directory for this run's logs
+        gpus: Device ids to expose through CUDA_VISIBLE_DEVICES, if any
+        in_process: Call train.run(config) in this process instead of
+            launching ``python train.py``
+    """
     log_path = Path(log_dir)
     log_path.mkdir(parents=True, exist_ok=True)
 
+    if in_process:
+        if gpus:
+            os.environ["CUDA_VISIBLE_DEVICES"] = ",".join(gpus)
+        return _run_in_process(config, log_path)
+
     # Build command
     cmd = ["python", "train.py"]
     for key, value in config.items():
         cmd.extend([f"--{key}", str(value)])
 
-    # Run and capture output
-    result = subprocess.run(cmd, capture_output=True, text=True, cwd=log_path.parent)
+    if gpus is None:
+        gpus = _worker_gpus
+
+    env = None
+    if gpus:
+        env = {**os.environ, "CUDA_VISIBLE_DEVICES": ",".join(gpus)}
+
+    # Stream output to per-run log files rather than holding it in memory
+    stdout_path = log_path / "stdout.log"
+    stderr_path = log_path / "stderr.log"
+    with open(stdout_path, "wb") as stdout, open(stderr_path, "wb") as stderr:
+        result = subprocess.run(
+            cmd, stdout=stdout, stderr=stderr, cwd=log_path.parent, env=env
+        )
 
     return {
         "config": config,
         "returncode": result.returncode,
-        "stdout": result.stdout,
-        "stderr": result.stderr,
+        "stdout_path": str(stdout_path),
+        "stderr_path": str(stderr_path),
     }
 
 
-def grid_search(configs: List[Dict], log_dir: str) -> List[Dict]:
+def _dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize results to UTF-8 JSON, with orjson when it is installed."""
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+
+def gpu_slots(gpus: List[str], gpus_per_job: int) -> List[List[str]]:
+    """Split device ids into disjoint groups of gpus_per_job, one per job slot."""
+    if gpus_per_job <= 0:
+        return []
+    return [
+        gpus[i : i + gpus_per_job]
+        for i in range(0, len(gpus) - gpus_per_job + 1, gpus_per_job)
+    ]
+
+
+def run_trials(
+    trials: List[tuple],
+    jobs: int = 1,
+    slots: Optional[List[List[str]]] = None,
+    on_result: Optional[Callable[[Dict], None]] = None,
+    in_process: bool = False,
+) -> List[Dict]:
+    """Run (config, log_dir) trials, up to `jobs` at a time.
+
+    Trials are independent, so they are spread over a process pool; results
+    come back in trial order. With GPU slots, each worker claims one slot for
+    its lifetime, so concurrent trials never share devices. Without slots,
+    concurrent trials see the same devices. They also share the working
+    directory that holds train.py, so anything train.py writes there must
+    not collide between trials.
+
+    Args:
+        trials: (config, log_dir) pairs
+        jobs: Maximum number of trials running at once
+        slots: GPU id groups to hand out to workers
+        on_result: Called with each result as soon as its trial finishes
+        in_process: Run train.run(config) inside the workers instead of
+            starting a new interpreter per trial
+    """
+    if jobs <= 1:
+        gpus = slots[0] if slots else None
+        results = []
+        for config, log_dir in trials:
+            results.append(run_experiment(config, log_dir, gpus, in_process))
+            if on_result:
+                on_result(results[-1])
+        return results
+
+    pool_args = {}
+    if slots:
+        import multiprocessing
+
+        jobs = min(jobs, len(slots))
+        slot_queue = multiprocessing.Queue()
+        for slot in slots[:jobs]:
+            slot_queue.put(slot)
+        pool_args = {"initializer": _claim_gpu_slot, "initargs": (slot_queue,)}
+
+    with ProcessPoolExecutor(max_workers=jobs, **pool_args) as executor:
+        futures = [
+            executor.submit(run_experiment, config, log_dir, None, in_process)
+            for config, log_dir in trials
+        ]
+        if on_result:
+            for future in as_completed(futures):
+                on_result(future.result())
+        return [future.result() for future in futures]
+
+
+def _report_progress(
+    label: str, total: int, on_result: Optional[Callable[[Dict], None]]
+) -> Callable[[Dict], None]:
+    """Wrap on_result to print a progress line as each trial finishes."""
+    done = 0
+
+    def report(result: Dict) -> None:
+        nonlocal done
+        done += 1
+        status = "ok" if result["returncode"] == 0 else "failed"
+        print(f"Finished {label} {done}/{total} ({status}): {result['config']}")
+        if on_result:
+            on_result(result)
+
+    return report
+
+
+def grid_search(
+    configs: List[Dict],
+    log_dir: str,
+    jobs: int = 1,
+    slots: Optional[List[List[str]]] = None,
+    on_result: Optional[Callable[[Dict], None]] = None,
+    in_process: bool = False,
+) -> List[Dict]:
     """Run grid search over configs."""
-    results = []
-    for i, config in enumerate(configs):
-        print(f"Running experiment {i + 1}/{len(configs)}: {config}")
-        result = run_experiment(config, f"{log_dir}/exp_{i}")
-        results.append(result)
-    return results
+    trials = [(config, f"{log_dir}/exp_{i}") for i, config in enumerate(configs)]
+    report = _report_progress("experiment", len(trials), on_result)
+    return run_trials(trials, jobs, slots, report, in_process)
 
 
-def random_search(config_space: Dict, num_trials: int, log_dir: str) -> List[Dict]:
+def random_search(
+    config_space: Dict,
+    num_trials: int,
+    log_dir: str,
+    jobs: int = 1,
+    slots: Optional[List[List[str]]] = None,
+    on_result: Optional[Callable[[Dict], None]] = None,
+    in_process: bool = False,
+) -> List[Dict]:
     """Run random search over config space."""
     import random
 
-    results = []
+    trials = []
     for i in range(num_trials):
         config = {k: random.choice(v) for k, v in config_space.items()}
-        print(f"Running trial {i + 1}/{num_trials}: {config}")
-        result = run_experiment(config, f"{log_dir}/trial_{i}")
-        results.append(result)
-    return results
+        trials.append((config, f"{log_dir}/trial_{i}"))
+    report = _report_progress("trial", len(trials), on_result)
+    return run_trials(trials, jobs, slots, report, in_process)
 
 
 def main():
@@ -67,27 +271,87 @@ def main():
     parser.add_argument(
         "--log-dir", "-l", default="logs/experiments", help="Log directory"
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=max(1, (os.cpu_count() or 2) // 2),
+        help="Number of trials to run concurrently. Concurrent trials share the "
+        "directory holding train.py as their working directory",
+    )
+    parser.add_argument(
+        "--gpus-per-job",
+        type=int,
+        default=None,
+        help="GPUs to give each trial via CUDA_VISIBLE_DEVICES (default: 1 when "
+        "--gpus lists any and --jobs is above 1, so trials never share a "
+        "device; otherwise 0)",
+    )
+    parser.add_argument(
+        "--gpus",
+        default=os.environ.get("CUDA_VISIBLE_DEVICES", ""),
+        help="Comma-separated GPU ids to share out (default: CUDA_VISIBLE_DEVICES)",
+    )
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Import train.py once per worker and call its run(config) for each "
+        "trial instead of starting a new interpreter per trial",
+    )
     args = parser.parse_args()
 
-    if args.config:
-        with open(args.config) as f:
-            config = json.load(f)
-        results = [run_experiment(config, args.log_dir)]
-    elif args.grid:
-        with open(args.grid) as f:
-            configs = json.load(f)
-        results = grid_search(configs, args.log_dir)
-    elif args.random:
-        with open(args.random) as f:
-            config_space = json.load(f)
-        results = random_search(config_space, args.trials, args.log_dir)
-    else:
+    gpus = [g for g in args.gpus.split(",") if g]
+    jobs = args.jobs
+    gpus_per_job = args.gpus_per_job
+    if gpus_per_job is None:
+        # Give each concurrent trial its own device rather than all of them
+        gpus_per_job = 1 if gpus and jobs > 1 else 0
+    slots = gpu_slots(gpus, gpus_per_job)
+    if gpus_per_job > 0 and not slots:
+        parser.error("--gpus-per-job needs at least that many ids in --gpus")
+
+    if not (args.config or args.grid or args.random):
         print("Please specify --config, --grid, or --random")
         return
 
+    # Append each result to results.jsonl as its trial finishes, so a crash
+    # or interrupt mid-search keeps everything completed so far.
+    log_dir = Path(args.log_dir)
+    log_dir.mkdir(parents=True, exist_ok=True)
+    with open(log_dir / "results.jsonl", "wb") as jsonl:
+
+        def record(result: Dict) -> None:
+            jsonl.write(_dumps(result) + b"\n")
+            jsonl.flush()
+
+        if args.config:
+            with open(args.config) as f:
+                config = json.load(f)
+            gpus = slots[0] if slots else None
+            results = [run_experiment(config, args.log_dir, gpus, args.in_process)]
+            record(results[0])
+        elif args.grid:
+            with open(args.grid) as f:
+                configs = json.load(f)
+            results = grid_search(
+                configs, args.log_dir, jobs, slots, record, args.in_process
+            )
+        else:
+            with open(args.random) as f:
+                config_space = json.load(f)
+            results = random_search(
+                config_space,
+                args.trials,
+                args.log_dir,
+                jobs,
+                slots,
+                record,
+                args.in_process,
+            )
+
     # Save results
-    with open(f"{args.log_dir}/results.json", "w") as f:
-        json.dump(results, f, indent=2)
+    with open(f"{args.log_dir}/results.json", "wb") as f:
+        f.write(_dumps(results, indent=True))
     print(f"Results saved to {args.log_dir}/results.json")
 
 
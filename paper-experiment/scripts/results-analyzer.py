@@ -10,61 +10,211 @@ Usage:
 """
 
 import argparse
+import functools
+import hashlib
 import json
+import os
+import pickle
 import sys
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import numpy as np
 
+# Parsed result files are cached here, keyed on source path, mtime and size.
+CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "paperpilot"
+)
 
-def load_data(file_path: str) -> List[Dict]:
-    """Load experiment results from CSV or JSON file."""
+# Bump when the parsing in _parse_data changes, to invalidate old entries.
+_CACHE_VERSION = 3
 
-    path = Path(file_path)
+
+def _cache_file(path: Path, mtime_ns: int, size: int) -> Path:
+    """Return the on-disk cache location for a parsed input file."""
+    key = f"data:{_CACHE_VERSION}:{path}:{mtime_ns}:{size}"
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+    return CACHE_DIR / f"{digest}.pkl"
+
+
+def load_data(file_path: str) -> Dict[str, np.ndarray]:
+    """Load experiment results from CSV or JSON file as columns.
+
+    Each column is a NumPy array: numeric columns hold numbers (float64 with
+    NaN for missing cells), other columns hold the raw values, None where a
+    cell is missing.
+
+    Parsed columns are memoized in-process and cached under CACHE_DIR, so
+    loading an unchanged file again skips parsing altogether.
+    """
+    path = Path(file_path).resolve()
+    st = path.stat()
+    return dict(_load_data_cached(path, st.st_mtime_ns, st.st_size))
+
+
+@functools.lru_cache(maxsize=16)
+def _load_data_cached(path: Path, mtime_ns: int, size: int) -> Dict[str, np.ndarray]:
+    """Load columns through the on-disk cache; the stat fields key the memo."""
+    cache_file = _cache_file(path, mtime_ns, size)
+    try:
+        with open(cache_file, "rb") as f:
+            data = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        data = _parse_data(path)
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_file, "wb") as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            pass
+
+    # The memo hands the same arrays to every caller.
+    for column in data.values():
+        column.setflags(write=False)
+    return data
+
+
+def _parse_data(path: Path) -> Dict[str, np.ndarray]:
+    """Parse experiment results from a CSV or JSON file into columns."""
+
+    file_path = str(path)
     suffix = path.suffix.lower()
 
     if suffix == ".json":
         with open(file_path, "r", encoding="utf-8") as f:
             data = json.load(f)
             if isinstance(data, list):
-                return data
-            return [data]
+                return records_to_columns(data)
+            return records_to_columns([data])
     elif suffix == ".csv":
+        try:
+            import pyarrow as pa
+            from pyarrow import csv as pa_csv
+        except ImportError:
+            pa = None
+        if pa is not None:
+            # Arrow parses and types the columns in C++; numeric columns come
+            # out as NumPy arrays without per-row Python objects.
+            table = pa_csv.read_csv(file_path)
+            columns = {}
+            for name, column in zip(table.column_names, table.columns):
+                kind = column.type
+                if column.null_count and (
+                    pa.types.is_integer(kind)
+                    or pa.types.is_floating(kind)
+                    or pa.types.is_boolean(kind)
+                ):
+                    column = column.cast(pa.float64())
+                columns[name] = column.to_numpy()
+            return columns
         try:
             import pandas as pd
 
             df = pd.read_csv(file_path)
-            return df.to_dict("records")
+            return {name: df[name].to_numpy() for name in df.columns}
         except ImportError:
             print(
-                "Error: pandas required for CSV support. Install with: pip install pandas"
+                "Error: pyarrow or pandas required for CSV support. "
+                "Install with: pip install pyarrow"
             )
             sys.exit(1)
     else:
         raise ValueError(f"Unsupported file format: {suffix}")
 
 
+_NUMBER_TYPES = frozenset({int, float, bool})
+
+
+def records_to_columns(records: List[Dict]) -> Dict[str, np.ndarray]:
+    """Turn a list of records into a dict of column arrays.
+
+    Columns appear in first-seen key order. A column whose cells are all
+    numbers becomes a numeric array (float64 with NaN where cells are missing
+    or null); any other column becomes an object array with None for gaps.
+    """
+    keys = dict.fromkeys(key for record in records for key in record)
+    columns = {}
+    for key in keys:
+        cells = [record.get(key) for record in records]
+        kinds = set(map(type, cells))
+        if kinds <= _NUMBER_TYPES:
+            columns[key] = np.asarray(cells)
+        elif kinds - {type(None)} <= _NUMBER_TYPES and len(kinds) > 1:
+            columns[key] = np.asarray(
+                [np.nan if cell is None else cell for cell in cells],
+                dtype=np.float64,
+            )
+        else:
+            column = np.empty(len(cells), dtype=object)
+            column[:] = cells
+            columns[key] = column
+    return columns
+
+
+def num_rows(columns: Dict[str, np.ndarray]) -> int:
+    """Number of records in a column dict."""
+    return len(next(iter(columns.values()), ()))
+
+
+def _starts_numeric(column: np.ndarray) -> bool:
+    """Whether a column's first cell is a (present) number."""
+    if not len(column):
+        return False
+    if column.dtype.kind == "f":
+        return not np.isnan(column[0])
+    return column.dtype.kind in "biu" or isinstance(column[0], (int, float))
+
+
+def _as_float(column: np.ndarray) -> np.ndarray:
+    """Convert a column to float64, with NaN where a cell is not a number."""
+    if column.dtype.kind in "biuf":
+        return column.astype(np.float64, copy=False)
+
+    values = np.full(len(column), np.nan)
+    for i, cell in enumerate(column.tolist()):
+        try:
+            values[i] = float(cell)
+        except (ValueError, TypeError):
+            continue
+    return values
+
+
 def calculate_statistics(values: List[float]) -> Dict[str, float]:
     """Calculate summary statistics for a list of values."""
 
     if not values:
         return {}
 
-    arr = np.array(values)
+    arr = np.asarray(values, dtype=np.float64)
+
+    # One sort yields min, max and all three quartiles; NaN sorts last and,
+    # as with np.min/np.max, makes them NaN.
+    srt = np.sort(arr)
+    q25, median, q75 = np.percentile(srt, (25, 50, 75))
+    lowest, highest = (srt[0], srt[-1]) if not np.isnan(srt[-1]) else (np.nan,) * 2
 
     return {
         "count": len(values),
-        "mean": float(np.mean(arr)),
-        "std": float(np.std(arr, ddof=1)),
-        "min": float(np.min(arr)),
-        "max": float(np.max(arr)),
-        "median": float(np.median(arr)),
-        "q25": float(np.percentile(arr, 25)),
-        "q75": float(np.percentile(arr, 75)),
+        "mean": float(arr.mean()),
+        "std": float(arr.std(ddof=1)),
+        "min": float(lowest),
+        "max": float(highest),
+        "median": float(median),
+        "q25": float(q25),
+        "q75": float(q75),
     }
 
 
+@functools.lru_cache(maxsize=1024)
+def t_critical_value(dof: int, confidence: float) -> float:
+    """Two-sided Student's t critical value, memoized per (dof, confidence)."""
+    from scipy import stats
+
+    return float(stats.t.ppf((1 + confidence) / 2, dof))
+
+
 def calculate_confidence_interval(
     values: List[float],
     confidence: float = 0.95,
@@ -78,10 +228,7 @@ def calculate_confidence_interval(
     mean = np.mean(arr)
     se = np.std(arr, ddof=1) / np.sqrt(len(arr))
 
-    # t-distribution approximation (using 1.96 for 95% CI)
-    from scipy import stats
-
-    t_val = stats.t.ppf((1 + confidence) / 2, len(arr) - 1)
+    t_val = t_critical_value(len(arr) - 1, confidence)
 
     return {
         "mean": float(mean),
@@ -125,67 +272,170 @@ def generate_latex_table(
     return "\n".join(lines)
 
 
+def grouped_statistics(
+    codes: np.ndarray,
+    values: np.ndarray,
+    num_groups: int,
+    confidence: float = 0.95,
+    with_ci: bool = True,
+) -> List[Dict[str, float]]:
+    """Summary statistics and confidence intervals for many groups at once.
+
+    Equivalent to calculate_statistics plus calculate_confidence_interval on
+    each group, but computed with a handful of NumPy passes over all values
+    instead of a Python-level pass per group.
+
+    Args:
+        codes: Group index (0 .. num_groups - 1) of each value
+        values: Float values, with NaN already dropped
+        num_groups: Number of groups; every group must have at least one value
+        confidence: Confidence level for the intervals
+        with_ci: Whether to compute confidence intervals at all; without them
+            scipy is never imported
+
+    Returns:
+        One statistics dict per group, in group-index order
+    """
+    counts = np.bincount(codes, minlength=num_groups)
+    means = np.bincount(codes, weights=values, minlength=num_groups) / counts
+    deviations = values - means[codes]
+    sq_dev = np.bincount(codes, weights=deviations * deviations, minlength=num_groups)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        stds = np.sqrt(sq_dev / (counts - 1))
+
+    # One sort by (group, value) gives every group's order statistics.
+    sorted_values = values[np.lexsort((values, codes))]
+    starts = np.cumsum(counts) - counts
+    last = counts - 1
+
+    def quantile(q: float) -> np.ndarray:
+        # Linear interpolation, as np.percentile does by default.
+        pos = q * last
+        lower = np.floor(pos).astype(np.int64)
+        upper = np.minimum(lower + 1, last)
+        below = sorted_values[starts + lower]
+        return below + (pos - lower) * (sorted_values[starts + upper] - below)
+
+    q25, medians, q75 = quantile(0.25), quantile(0.5), quantile(0.75)
+    mins = sorted_values[starts]
+    maxs = sorted_values[starts + last]
+
+    summaries = [
+        {
+            "count": int(counts[i]),
+            "mean": float(means[i]),
+            "std": float(stds[i]),
+            "min": float(mins[i]),
+            "max": float(maxs[i]),
+            "median": float(medians[i]),
+            "q25": float(q25[i]),
+            "q75": float(q75[i]),
+        }
+        for i in range(num_groups)
+    ]
+    if not with_ci:
+        return summaries
+
+    ci_lower = mins.copy()
+    ci_upper = mins.copy()
+    multi = counts > 1
+    if multi.any():
+        from scipy import stats
+
+        t_vals = stats.t.ppf((1 + confidence) / 2, counts[multi] - 1)
+        margin = t_vals * stds[multi] / np.sqrt(counts[multi])
+        ci_lower[multi] = means[multi] - margin
+        ci_upper[multi] = means[multi] + margin
+
+    for summary, lower, upper in zip(summaries, ci_lower.tolist(), ci_upper.tolist()):
+        summary["ci_lower"] = lower
+        summary["ci_upper"] = upper
+    return summaries
+
+
 def analyze_by_column(
-    data: List[Dict],
+    data: Dict[str, np.ndarray],
     group_column: str,
     value_column: str,
+    confidence: float = 0.95,
+    with_ci: bool = True,
 ) -> Dict[str, Dict[str, float]]:
-    """Analyze results grouped by a column."""
+    """Analyze results grouped by a column.
 
-    groups: Dict[str, List[float]] = {}
+    Rows whose value is missing or not a number are skipped; rows without a
+    group fall into "unknown". Groups are reported in order of appearance.
+    """
 
-    for row in data:
-        group = str(row.get(group_column, "unknown"))
-        try:
-            value = float(row.get(value_column, 0))
-            if group not in groups:
-                groups[group] = []
-            groups[group].append(value)
-        except (ValueError, TypeError):
-            continue
+    if value_column not in data:
+        return {}
+    values = _as_float(data[value_column])
+
+    groups = data.get(group_column)
+    if groups is None:
+        groups = np.full(len(values), "unknown", dtype=object)
+    elif groups.dtype.kind not in "biuf":
+        groups = np.array(
+            ["unknown" if g is None else str(g) for g in groups.tolist()], dtype=object
+        )
 
-    results = {}
-    for group, values in groups.items():
-        stats = calculate_statistics(values)
-        ci = calculate_confidence_interval(values)
-        stats.update(ci)
-        results[group] = stats
+    keep = ~np.isnan(values)
+    values = values[keep]
+    if not values.size:
+        return {}
 
-    return results
+    labels, first_seen, codes = np.unique(
+        groups[keep], return_index=True, return_inverse=True
+    )
+    # np.unique sorts labels; renumber groups by first appearance instead.
+    order = np.argsort(first_seen, kind="stable")
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+
+    summaries = grouped_statistics(
+        rank[codes.ravel()], values, len(labels), confidence, with_ci
+    )
+    names = [str(label) for label in labels[order].tolist()]
+    return dict(zip(names, summaries))
 
 
 def analyze_all_columns(
-    data: List[Dict],
+    data: Dict[str, np.ndarray],
     value_columns: Optional[List[str]] = None,
+    confidence: float = 0.95,
+    with_ci: bool = True,
 ) -> Dict[str, Dict[str, float]]:
     """Analyze all numeric columns in the data."""
 
     if not data:
         return {}
 
-    # Find numeric columns
+    # Find numeric columns: those whose first record holds a number
     if value_columns is None:
-        value_columns = []
-        for key, value in data[0].items():
-            if isinstance(value, (int, float)):
-                value_columns.append(key)
-
-    results = {}
+        value_columns = [
+            name for name, column in data.items() if _starts_numeric(column)
+        ]
+
+    # Gather every column into one value array tagged with column codes, so
+    # all columns are summarized together by a single grouped pass.
+    columns = []
+    arrays = []
     for col in value_columns:
-        values = []
-        for row in data:
-            try:
-                values.append(float(row.get(col, 0)))
-            except (ValueError, TypeError):
-                continue
+        if col not in data:
+            continue
+        values = _as_float(data[col])
+        values = values[~np.isnan(values)]
+        if values.size:
+            columns.append(col)
+            arrays.append(values)
 
-        if values:
-            stats = calculate_statistics(values)
-            ci = calculate_confidence_interval(values)
-            stats.update(ci)
-            results[col] = stats
+    if not columns:
+        return {}
 
-    return results
+    codes = np.repeat(np.arange(len(columns)), [len(a) for a in arrays])
+    summaries = grouped_statistics(
+        codes, np.concatenate(arrays), len(columns), confidence, with_ci
+    )
+    return dict(zip(columns, summaries))
 
 
 def create_comparison_chart(
@@ -216,6 +466,38 @@ def create_comparison_chart(
     print(f"Chart saved to: {output_path}")
 
 
+def analyze(
+    data: Dict[str, np.ndarray], args: argparse.Namespace
+) -> Dict[str, Dict[str, float]]:
+    """Run the analysis selected on the command line."""
+    with_ci = not args.no_ci
+    if args.group_by and args.value:
+        return analyze_by_column(
+            data, args.group_by, args.value, args.confidence, with_ci
+        )
+    return analyze_all_columns(data, args.columns, args.confidence, with_ci)
+
+
+def serve_stdin(args: argparse.Namespace) -> None:
+    """Analyze newline-delimited JSON datasets from stdin until EOF.
+
+    Each input line is a JSON array of records (or a single record); each
+    output line is the JSON analysis of it, or {"error": ...}.
+    """
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        try:
+            records = json.loads(line)
+            if not isinstance(records, list):
+                records = [records]
+            results = analyze(records_to_columns(records), args)
+        except Exception as e:
+            results = {"error": str(e)}
+        sys.stdout.write(json.dumps(results) + "\n")
+        sys.stdout.flush()
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Analyze experiment results and generate tables for papers",
@@ -231,9 +513,14 @@ Examples:
     parser.add_argument(
         "--input",
         "-i",
-        required=True,
         help="Input CSV or JSON file with experiment results",
     )
+    parser.add_argument(
+        "--stdin",
+        action="store_true",
+        help="Read one JSON dataset per line from stdin and write one JSON "
+        "result per line, so a driver loop pays the startup cost only once",
+    )
     parser.add_argument(
         "--output",
         "-o",
@@ -268,6 +555,11 @@ Examples:
         default=0.95,
         help="Confidence level (default: 0.95)",
     )
+    parser.add_argument(
+        "--no-ci",
+        action="store_true",
+        help="Skip confidence intervals (avoids importing scipy)",
+    )
     parser.add_argument(
         "--format",
         choices=["json", "text"],
@@ -277,21 +569,24 @@ Examples:
 
     args = parser.parse_args()
 
+    if args.stdin:
+        serve_stdin(args)
+        return
+    if not args.input:
+        parser.error("--input is required unless --stdin is given")
+
     try:
         # Load data
         data = load_data(args.input)
 
-        if not data:
+        if not num_rows(data):
             print("Error: No data found in input file")
             sys.exit(1)
 
-        print(f"Loaded {len(data)} records from {args.input}")
+        print(f"Loaded {num_rows(data)} records from {args.input}")
 
         # Analyze data
-        if args.group_by and args.value:
-            results = analyze_by_column(data, args.group_by, args.value)
-        else:
-            results = analyze_all_columns(data, args.columns)
+        results = analyze(data, args)
 
         if not results:
             print("Error: No numeric columns found for analysis")
@@ -338,9 +633,11 @@ Examples:
                     print(f"\n{metric}:")
                     print(f"  Mean: {stats.get('mean', 0):.4f}")
                     print(f"  Std:  {stats.get('std', 0):.4f}")
-                    print(
-                        f"  95% CI: [{stats.get('ci_lower', 0):.4f}, {stats.get('ci_upper', 0):.4f}]"
-                    )
+                    if "ci_lower" in stats:
+                        print(
+                            f"  95% CI: [{stats['ci_lower']:.4f}, "
+                            f"{stats['ci_upper']:.4f}]"
+                        )
 
         # Generate chart if requested
         if args.chart:
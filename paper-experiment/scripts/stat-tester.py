@@ -10,7 +10,10 @@ Usage:
 """
 
 import argparse
+import functools
+import hashlib
 import json
+import os
 import sys
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -18,54 +21,140 @@ from typing import Any, Dict, List, Optional
 import numpy as np
 from scipy import stats
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def load_values(file_path: str) -> List[float]:
-    """Load numeric values from CSV or JSON file."""
+# Parsed value arrays are cached here, keyed on source path, mtime and size.
+CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "paperpilot"
+)
+
+# Bump when the parsing in _parse_values changes, to invalidate old entries.
+_CACHE_VERSION = 1
+
+
+def _cache_file(path: Path, mtime_ns: int, size: int) -> Path:
+    """Return the on-disk cache location for a parsed input file."""
+    key = f"values:{_CACHE_VERSION}:{path}:{mtime_ns}:{size}"
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+    return CACHE_DIR / f"{digest}.npy"
+
+
+def load_values(file_path: str) -> np.ndarray:
+    """Load numeric values from CSV or JSON file as a float64 array.
+
+    Parsed values are memoized in-process and cached under CACHE_DIR, so
+    loading an unchanged file again skips parsing altogether. The returned
+    array is shared with the memo and therefore read-only.
+    """
+    path = Path(file_path).resolve()
+    st = path.stat()
+    return _load_values_cached(path, st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=64)
+def _load_values_cached(path: Path, mtime_ns: int, size: int) -> np.ndarray:
+    """Load values through the on-disk cache; the stat fields key the memo."""
+    cache_file = _cache_file(path, mtime_ns, size)
+    try:
+        values = np.load(cache_file, allow_pickle=False)
+    except (OSError, ValueError):
+        values = _parse_values(path)
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_file, "wb") as f:
+                np.save(f, values)
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            pass
+
+    values.setflags(write=False)
+    return values
+
+
+def _parse_values(path: Path) -> np.ndarray:
+    """Parse numeric values from a CSV or JSON file."""
     
-    path = Path(file_path)
+    file_path = str(path)
     suffix = path.suffix.lower()
     
     if suffix == ".json":
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            if isinstance(data, list):
-                if data and isinstance(data[0], dict):
-                    values = []
-                    for item in data:
-                        for v in item.values():
-                            if isinstance(v, (int, float)):
-                                values.append(float(v))
-                                break
-                    return values
-                return [float(x) for x in data if isinstance(x, (int, float))]
-            return []
+        if orjson is not None:
+            data = orjson.loads(path.read_bytes())
+        else:
+            with open(file_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        if isinstance(data, list):
+            if data and isinstance(data[0], dict):
+                return _first_numeric_values(data)
+            return np.asarray(
+                [x for x in data if isinstance(x, (int, float))], dtype=np.float64
+            )
+        return np.empty(0)
     elif suffix == ".csv":
+        try:
+            import pyarrow as pa
+            from pyarrow import csv as pa_csv
+        except ImportError:
+            pa = None
+        if pa is not None:
+            # Arrow's multithreaded C++ reader types the columns without
+            # paying for the pandas import or a DataFrame.
+            table = pa_csv.read_csv(file_path)
+            for column in table.columns:
+                kind = column.type
+                if (
+                    pa.types.is_integer(kind)
+                    or pa.types.is_floating(kind)
+                    or pa.types.is_boolean(kind)
+                ):
+                    return column.drop_null().to_numpy().astype(np.float64)
+            return np.empty(0)
         try:
             import pandas as pd
             df = pd.read_csv(file_path)
             for col in df.columns:
                 if pd.api.types.is_numeric_dtype(df[col]):
-                    return df[col].dropna().tolist()
-            return []
+                    return df[col].dropna().to_numpy(dtype=np.float64)
+            return np.empty(0)
         except ImportError:
-            print("Error: pandas required for CSV support")
+            print("Error: pyarrow or pandas required for CSV support")
             sys.exit(1)
     else:
         raise ValueError(f"Unsupported file format: {suffix}")
 
 
-def cohens_d(group1: List[float], group2: List[float]) -> float:
+def _first_numeric_values(records: List[Dict[str, Any]]) -> np.ndarray:
+    """Take the first numeric field of each record, as a float64 array.
+
+    Records without a numeric field are skipped.
+    """
+
+    def first_numbers():
+        for item in records:
+            for v in item.values():
+                if isinstance(v, (int, float)):
+                    yield v
+                    break
+
+    return np.fromiter(first_numbers(), dtype=np.float64)
+
+
+def cohens_d(group1: np.ndarray, group2: np.ndarray) -> float:
     """Calculate Cohen's d effect size."""
     
     n1, n2 = len(group1), len(group2)
-    var1, var2 = np.var(group1, ddof=1), np.var(group2, ddof=1)
+    var1, var2 = group1.var(ddof=1), group2.var(ddof=1)
     
     pooled_std = np.sqrt(((n1 - 1) * var1 + (n2 - 1) * var2) / (n1 + n2 - 2))
     
     if pooled_std == 0:
         return 0.0
     
-    return (np.mean(group1) - np.mean(group2)) / pooled_std
+    return (group1.mean() - group2.mean()) / pooled_std
 
 
 def interpret_effect_size(d: float) -> str:
@@ -83,8 +172,8 @@ def interpret_effect_size(d: float) -> str:
 
 
 def t_test(
-    group1: List[float],
-    group2: List[float],
+    group1: np.ndarray,
+    group2: np.ndarray,
     paired: bool = False,
     alternative: str = "two-sided",
 ) -> Dict[str, Any]:
@@ -98,22 +187,30 @@ def t_test(
     else:
         statistic, pvalue = stats.ttest_ind(group1, group2, alternative=alternative)
     
+    # Moments are computed once and shared by Cohen's d and the summary.
+    n1, n2 = len(group1), len(group2)
+    mean1, mean2 = group1.mean(), group2.mean()
+    var1, var2 = group1.var(ddof=1), group2.var(ddof=1)
+    
+    pooled_std = np.sqrt(((n1 - 1) * var1 + (n2 - 1) * var2) / (n1 + n2 - 2))
+    d = (mean1 - mean2) / pooled_std if pooled_std != 0 else 0.0
+    
     return {
         "test": "paired t-test" if paired else "independent t-test",
         "statistic": float(statistic),
         "p_value": float(pvalue),
-        "effect_size": cohens_d(group1, group2),
-        "effect_interpretation": interpret_effect_size(cohens_d(group1, group2)),
-        "mean_group1": float(np.mean(group1)),
-        "mean_group2": float(np.mean(group2)),
-        "std_group1": float(np.std(group1, ddof=1)),
-        "std_group2": float(np.std(group2, ddof=1)),
+        "effect_size": d,
+        "effect_interpretation": interpret_effect_size(d),
+        "mean_group1": float(mean1),
+        "mean_group2": float(mean2),
+        "std_group1": float(np.sqrt(var1)),
+        "std_group2": float(np.sqrt(var2)),
     }
 
 
 def mann_whitney_test(
-    group1: List[float],
-    group2: List[float],
+    group1: np.ndarray,
+    group2: np.ndarray,
     alternative: str = "two-sided",
 ) -> Dict[str, Any]:
     """Perform Mann-Whitney U test (non-parametric)."""
@@ -133,8 +230,8 @@ def mann_whitney_test(
 
 
 def wilcoxon_test(
-    group1: List[float],
-    group2: List[float],
+    group1: np.ndarray,
+    group2: np.ndarray,
     alternative: str = "two-sided",
 ) -> Dict[str, Any]:
     """Perform Wilcoxon signed-rank test (paired non-parametric)."""
@@ -151,16 +248,20 @@ def wilcoxon_test(
     }
 
 
-def anova_test(*groups: List[float]) -> Dict[str, Any]:
+def anova_test(*groups: np.ndarray) -> Dict[str, Any]:
     """Perform one-way ANOVA."""
     
     statistic, pvalue = stats.f_oneway(*groups)
     
-    group_means = [np.mean(g) for g in groups]
-    grand_mean = np.mean([x for g in groups for x in g])
+    all_values = np.concatenate(groups)
+    grand_mean = all_values.mean()
+    sizes = np.fromiter((len(g) for g in groups), dtype=np.int64, count=len(groups))
+    group_means = np.fromiter(
+        (g.mean() for g in groups), dtype=np.float64, count=len(groups)
+    )
     
-    ss_between = sum(len(g) * (m - grand_mean) ** 2 for g, m in zip(groups, group_means))
-    ss_total = sum((x - grand_mean) ** 2 for g in groups for x in g)
+    ss_between = float((sizes * (group_means - grand_mean) ** 2).sum())
+    ss_total = float(((all_values - grand_mean) ** 2).sum())
     
     eta_squared = ss_between / ss_total if ss_total > 0 else 0
     
@@ -174,7 +275,7 @@ def anova_test(*groups: List[float]) -> Dict[str, Any]:
     }
 
 
-def kruskal_test(*groups: List[float]) -> Dict[str, Any]:
+def kruskal_test(*groups: np.ndarray) -> Dict[str, Any]:
     """Perform Kruskal-Wallis H test (non-parametric ANOVA)."""
     
     statistic, pvalue = stats.kruskal(*groups)
@@ -191,52 +292,68 @@ def bonferroni_correction(pvalues: List[float], alpha: float = 0.05) -> List[Dic
     """Apply Bonferroni correction for multiple comparisons."""
     
     n = len(pvalues)
-    corrected_alpha = alpha / n
+    if n == 0:
+        return []
     
-    results = []
-    for i, p in enumerate(pvalues):
-        results.append({
-            "comparison": i + 1,
-            "original_p": p,
-            "corrected_p": min(p * n, 1.0),
-            "significant": p < corrected_alpha,
-        })
+    p = np.asarray(pvalues, dtype=np.float64)
+    corrected = np.minimum(p * n, 1.0)
+    significant = p < alpha / n
     
-    return results
+    return [
+        {
+            "comparison": i + 1,
+            "original_p": pvalues[i],
+            "corrected_p": corrected_p,
+            "significant": sig,
+        }
+        for i, (corrected_p, sig) in enumerate(
+            zip(corrected.tolist(), significant.tolist())
+        )
+    ]
 
 
 def holm_bonferroni_correction(pvalues: List[float], alpha: float = 0.05) -> List[Dict]:
     """Apply Holm-Bonferroni correction for multiple comparisons."""
     
     n = len(pvalues)
-    sorted_indices = np.argsort(pvalues)
-    sorted_p = [pvalues[i] for i in sorted_indices]
-    
-    results = []
-    for rank, (orig_idx, p) in enumerate(zip(sorted_indices, sorted_p), 1):
-        corrected_alpha = alpha / (n - rank + 1)
-        results.append({
-            "comparison": orig_idx + 1,
-            "original_p": p,
-            "corrected_p": p * (n - rank + 1),
-            "threshold": corrected_alpha,
-            "significant": p < corrected_alpha,
-        })
-    
-    results.sort(key=lambda x: x["comparison"])
-    
-    any_significant = False
-    for r in results:
-        if not any_significant:
-            if r["significant"]:
-                r["still_significant"] = True
-            else:
-                any_significant = True
-                r["still_significant"] = False
-        else:
-            r["still_significant"] = False
-    
-    return results
+    if n == 0:
+        return []
+    
+    p = np.asarray(pvalues, dtype=np.float64)
+    order = np.argsort(p, kind="stable")
+    ranks = np.empty(n, dtype=np.int64)
+    ranks[order] = np.arange(n)
+    
+    # The i-th smallest p-value is tested against alpha / (n - i).
+    k = n - ranks
+    thresholds = alpha / k
+    significant = p < thresholds
+    corrected = np.minimum(p * k, 1.0)
+    
+    # Step-down: every hypothesis from the first non-rejection on, in order
+    # of increasing p-value, is retained.
+    failed = np.flatnonzero(~significant[order])
+    cutoff = failed[0] if failed.size else n
+    still_significant = ranks < cutoff
+    
+    return [
+        {
+            "comparison": i + 1,
+            "original_p": pvalues[i],
+            "corrected_p": corrected_p,
+            "threshold": threshold,
+            "significant": sig,
+            "still_significant": still,
+        }
+        for i, (corrected_p, threshold, sig, still) in enumerate(
+            zip(
+                corrected.tolist(),
+                thresholds.tolist(),
+                significant.tolist(),
+                still_significant.tolist(),
+            )
+        )
+    ]
 
 
 def main():
@@ -277,7 +394,7 @@ def main():
             group1 = load_values(args.group1)
             group2 = load_values(args.group2)
             
-            if not group1 or not group2:
+            if group1.size == 0 or group2.size == 0:
                 print("Error: Failed to load values from files")
                 sys.exit(1)
             
@@ -323,7 +440,7 @@ def main():
         elif args.test in ["anova", "kruskal"]:
             groups = [load_values(g) for g in args.groups]
             
-            if not all(groups):
+            if not all(g.size for g in groups):
                 print("Error: Failed to load values from files")
                 sys.exit(1)
             
@@ -9,13 +9,111 @@ assesses feasibility, and designs experiments for validation.
 import argparse
 import json
 import sys
-from typing import List, Dict, Any, Optional
+from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
+from functools import lru_cache
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Feasibility lookups: requirement value -> (label, score)
+_DATA_REQ_MAP = {
+    "available": ("available", 10),
+    "public_dataset": ("available", 10),
+    "needs_collection": ("needs_collection", 5),
+    "simulation": ("needs_collection", 5),
+    "unavailable": ("unavailable", 0),
+}
+_COMPLEXITY_MAP = {
+    "low": ("feasible", 10),
+    "medium": ("feasible", 7),
+    "high": ("challenging", 4),
+}
+_TOOLS_MAP = {
+    "standard_tools": ("yes", 10),
+    "specialized_tools": ("limited", 5),
+    "custom_implementation": ("no", 0),
+}
+_TIME_MAP = {
+    "low": ("available", 10),
+    "medium": ("constrained", 6),
+    "high": ("insufficient", 3),
+}
+_COMPUTE_MAP = {
+    "low": ("available", 10),
+    "medium": ("constrained", 6),
+    "high": ("insufficient", 3),
+    "highly_specialized": ("unavailable", 0),
+}
+_VALIDATION_MAP = {
+    "quantitative": ("statistical", 10),
+    "qualitative": ("experimental", 8),
+    "mixed": ("mixed", 7),
+    "theoretical": ("theoretical", 4),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class DataAssessment:
+    """Whether the data needed to test a hypothesis is available."""
+
+    data: str
+    data_score: int
+    discipline: str
+    data_feasibility: bool
+
+
+@dataclass(frozen=True, slots=True)
+class MethodAssessment:
+    """Whether a proposed method is technically feasible.
+
+    tools_available and tools_score are None when the method requirements
+    are not one of the known kinds.
+    """
+
+    method: str
+    method_score: int
+    tools_available: Optional[str]
+    tools_score: Optional[int]
+    discipline: str
+    method_feasibility: bool
+
+
+@dataclass(frozen=True, slots=True)
+class ResourceAssessment:
+    """Whether the time and compute a hypothesis needs are available."""
+
+    time: str
+    time_score: int
+    compute: str
+    compute_score: int
+    discipline: str
+    resource_feasibility: bool
+
+
+@dataclass(frozen=True, slots=True)
+class ValidationAssessment:
+    """How a hypothesis can be validated or disproved."""
+
+    validation_type: str
+    validation_score: int
+    metrics_feasible: str
+    metrics_score: int
+    discipline: str
+    validation_feasibility: float
 
 
 def assess_data_feasibility(
     hypothesis_data: Dict[str, Any], discipline: str = "cs"
-) -> Dict[str, str]:
+) -> DataAssessment:
     """Assess if required data is available for testing hypothesis.
 
     Args:
@@ -23,31 +121,31 @@ def assess_data_feasibility(
         discipline: Academic discipline code
 
     Returns:
-        Dictionary with feasibility assessment
+        Data feasibility assessment
     """
-    assessment = {}
-
     data_requirements = hypothesis_data.get("data_requirements", "unknown")
 
-    if data_requirements == "available" or data_requirements == "public_dataset":
-        assessment["data"] = "available"
-        assessment["data_score"] = 10
-    elif data_requirements == "needs_collection" or data_requirements == "simulation":
-        assessment["data"] = "needs_collection"
-        assessment["data_score"] = 5
-    elif data_requirements == "unavailable":
-        assessment["data"] = "unavailable"
-        assessment["data_score"] = 0
+    return _assess_data(data_requirements, discipline)
+
 
-    assessment["discipline"] = discipline
-    assessment["data_feasibility"] = assessment["data_score"] >= 5
+# The assessments are frozen, so the cached cores can hand out the same
+# instance to every caller.
+@lru_cache(maxsize=1024)
+def _assess_data(data_requirements: str, discipline: str) -> DataAssessment:
+    """Cached core of assess_data_feasibility."""
+    data, data_score = _DATA_REQ_MAP.get(data_requirements, ("unknown", 0))
 
-    return assessment
+    return DataAssessment(
+        data=data,
+        data_score=data_score,
+        discipline=discipline,
+        data_feasibility=data_score >= 5,
+    )
 
 
 def assess_method_feasibility(
     hypothesis_data: Dict[str, Any], discipline: str = "cs"
-) -> Dict[str, str]:
+) -> MethodAssessment:
     """Assess if proposed method is technically feasible.
 
     Args:
@@ -55,47 +153,35 @@ def assess_method_feasibility(
         discipline: Academic discipline code
 
     Returns:
-        Dictionary with feasibility assessment
+        Method feasibility assessment
     """
-    assessment = {}
-
-    proposed_method = hypothesis_data.get("method", "unknown")
     complexity = hypothesis_data.get("complexity", "medium")
-
-    if complexity == "low":
-        assessment["method"] = "feasible"
-        assessment["method_score"] = 10
-    elif complexity == "medium":
-        assessment["method"] = "feasible"
-        assessment["method_score"] = 7
-    elif complexity == "high":
-        assessment["method"] = "challenging"
-        assessment["method_score"] = 4
-    else:
-        assessment["method"] = "unknown"
-        assessment["method_score"] = 3
-
     method_requirements = hypothesis_data.get("method_requirements", "none")
 
-    if method_requirements == "standard_tools":
-        assessment["tools_available"] = "yes"
-        assessment["tools_score"] = 10
-    elif method_requirements == "specialized_tools":
-        assessment["tools_available"] = "limited"
-        assessment["tools_score"] = 5
-    elif method_requirements == "custom_implementation":
-        assessment["tools_available"] = "no"
-        assessment["tools_score"] = 0
+    return _assess_method(complexity, method_requirements, discipline)
 
-    assessment["discipline"] = discipline
-    assessment["method_feasibility"] = assessment["method_score"] >= 7
 
-    return assessment
+@lru_cache(maxsize=1024)
+def _assess_method(
+    complexity: str, method_requirements: str, discipline: str
+) -> MethodAssessment:
+    """Cached core of assess_method_feasibility."""
+    method, method_score = _COMPLEXITY_MAP.get(complexity, ("unknown", 3))
+    tools_available, tools_score = _TOOLS_MAP.get(method_requirements, (None, None))
+
+    return MethodAssessment(
+        method=method,
+        method_score=method_score,
+        tools_available=tools_available,
+        tools_score=tools_score,
+        discipline=discipline,
+        method_feasibility=method_score >= 7,
+    )
 
 
 def assess_resource_feasibility(
     hypothesis_data: Dict[str, Any], discipline: str = "cs"
-) -> Dict[str, str]:
+) -> ResourceAssessment:
     """Assess if required resources (time, compute, tools) are available.
 
     Args:
@@ -103,54 +189,37 @@ def assess_resource_feasibility(
         discipline: Academic discipline code
 
     Returns:
-        Dictionary with resource feasibility assessment
+        Resource feasibility assessment
     """
-    assessment = {}
-
     time_requirement = hypothesis_data.get("time_requirement", "medium")
-
-    if time_requirement == "low":
-        assessment["time"] = "available"
-        assessment["time_score"] = 10
-    elif time_requirement == "medium":
-        assessment["time"] = "constrained"
-        assessment["time_score"] = 6
-    elif time_requirement == "high":
-        assessment["time"] = "insufficient"
-        assessment["time_score"] = 3
-    else:
-        assessment["time"] = "unknown"
-        assessment["time_score"] = 5
-
     compute_requirement = hypothesis_data.get("compute_requirement", "none")
 
-    if compute_requirement == "low":
-        assessment["compute"] = "available"
-        assessment["compute_score"] = 10
-    elif compute_requirement == "medium":
-        assessment["compute"] = "constrained"
-        assessment["compute_score"] = 6
-    elif compute_requirement == "high":
-        assessment["compute"] = "insufficient"
-        assessment["compute_score"] = 3
-    elif compute_requirement == "highly_specialized":
-        assessment["compute"] = "unavailable"
-        assessment["compute_score"] = 0
-    else:
-        assessment["compute"] = "unknown"
-        assessment["compute_score"] = 5
+    return _assess_resources(time_requirement, compute_requirement, discipline)
 
-    assessment["discipline"] = discipline
 
-    overall_feasibility = (assessment["time_score"] + assessment["compute_score"]) / 2
-    assessment["resource_feasibility"] = overall_feasibility >= 6
+@lru_cache(maxsize=1024)
+def _assess_resources(
+    time_requirement: str, compute_requirement: str, discipline: str
+) -> ResourceAssessment:
+    """Cached core of assess_resource_feasibility."""
+    time, time_score = _TIME_MAP.get(time_requirement, ("unknown", 5))
+    compute, compute_score = _COMPUTE_MAP.get(compute_requirement, ("unknown", 5))
 
-    return assessment
+    overall_feasibility = (time_score + compute_score) / 2
+
+    return ResourceAssessment(
+        time=time,
+        time_score=time_score,
+        compute=compute,
+        compute_score=compute_score,
+        discipline=discipline,
+        resource_feasibility=overall_feasibility >= 6,
+    )
 
 
 def assess_validation_path(
     hypothesis_data: Dict[str, Any], discipline: str = "cs"
-) -> Dict[str, str]:
+) -> ValidationAssessment:
     """Assess how hypothesis can be validated or disproved.
 
     Args:
@@ -158,43 +227,36 @@ def assess_validation_path(
         discipline: Academic discipline code
 
     Returns:
-        Dictionary with validation path assessment
+        Validation path assessment
     """
-    assessment = {}
-
     validation_method = hypothesis_data.get("validation_method", "unknown")
+    metrics_available = bool(hypothesis_data.get("metrics_available", True))
 
-    if validation_method == "quantitative":
-        assessment["validation_type"] = "statistical"
-        assessment["validation_score"] = 10
-    elif validation_method == "qualitative":
-        assessment["validation_type"] = "experimental"
-        assessment["validation_score"] = 8
-    elif validation_method == "mixed":
-        assessment["validation_type"] = "mixed"
-        assessment["validation_score"] = 7
-    elif validation_method == "theoretical":
-        assessment["validation_type"] = "theoretical"
-        assessment["validation_score"] = 4
-    else:
-        assessment["validation_type"] = "unknown"
-        assessment["validation_score"] = 2
+    return _assess_validation(validation_method, metrics_available, discipline)
 
-    metrics_available = hypothesis_data.get("metrics_available", True)
+
+@lru_cache(maxsize=1024)
+def _assess_validation(
+    validation_method: str, metrics_available: bool, discipline: str
+) -> ValidationAssessment:
+    """Cached core of assess_validation_path."""
+    validation_type, validation_score = _VALIDATION_MAP.get(
+        validation_method, ("unknown", 2)
+    )
 
     if metrics_available:
-        assessment["metrics_feasible"] = "yes"
-        assessment["metrics_score"] = 10
+        metrics_feasible, metrics_score = "yes", 10
     else:
-        assessment["metrics_feasible"] = "limited"
-        assessment["metrics_score"] = 3
-
-    assessment["discipline"] = discipline
-    assessment["validation_feasibility"] = (
-        assessment["validation_score"] + assessment["metrics_score"]
-    ) / 2
-
-    return assessment
+        metrics_feasible, metrics_score = "limited", 3
+
+    return ValidationAssessment(
+        validation_type=validation_type,
+        validation_score=validation_score,
+        metrics_feasible=metrics_feasible,
+        metrics_score=metrics_score,
+        discipline=discipline,
+        validation_feasibility=(validation_score + metrics_score) / 2,
+    )
 
 
 def generate_hypotheses(
@@ -213,10 +275,11 @@ def generate_hypotheses(
         return []
 
     key_papers = context.get("key_papers", [])
+    gap_l = research_gap.lower()
 
     hypotheses = []
 
-    if "attention" in research_gap.lower() and "transformer" in research_gap.lower():
+    if "attention" in gap_l and "transformer" in gap_l:
         hypotheses.append(
             {
                 "id": "H1",
@@ -240,7 +303,7 @@ def generate_hypotheses(
             }
         )
 
-    if "efficiency" in research_gap.lower() and "transformer" in research_gap.lower():
+    if "efficiency" in gap_l and "transformer" in gap_l:
         hypotheses.append(
             {
                 "id": "H2",
@@ -264,7 +327,7 @@ def generate_hypotheses(
             }
         )
 
-    if "long_range" in research_gap.lower() and "transformer" in research_gap.lower():
+    if "long_range" in gap_l and "transformer" in gap_l:
         hypotheses.append(
             {
                 "id": "H3",
@@ -311,40 +374,39 @@ def design_experiments(
         feasibility = hypothesis.get("feasibility", {})
         existing_design = hypothesis.get("experiment_design", {})
 
-        experiment_designs = []
-
-        for exp_num in range(1, 4):
-            exp_id = f"{hypothesis_id}-E{exp_num}"
-            exp_design = {
-                "id": exp_id,
+        # Everything but the id, name and type is the same for all three
+        independent = variables.get("independent")
+        dependent = variables.get("dependent")
+        control = existing_design.get("control", ["Standard"])
+        treatment = existing_design.get("treatment", ["Standard"])
+        metrics = existing_design.get("metrics", ["accuracy", "F1"])
+        statistics = existing_design.get("statistics", ["paired t-test"])
+        dataset = feasibility.get("data", "available")
+        sample_size = "1000" if dataset else 100
+        name = f"{hypothesis['statement'][:50]}... Experiment"
+        description = f"Validate {hypothesis_id} by varying {variables.get('independent', 'variable')}"
+
+        experiment_designs = [
+            {
+                "id": f"{hypothesis_id}-E{exp_num}",
                 "hypothesis_id": hypothesis_id,
-                "name": f"{hypothesis['statement'][:50]}... Experiment {exp_num}",
-                "description": f"Validate {hypothesis_id} by varying {variables.get('independent', 'variable')}",
+                "name": f"{name} {exp_num}",
+                "description": description,
                 "type": "validation" if exp_num == 1 else "comparison",
                 "variables": {
-                    "independent_variable": variables.get("independent"),
-                    "dependent_variable": variables.get("dependent"),
-                    "control_levels": existing_design.get("control", ["Standard"])
-                    if exp_num == 1
-                    else existing_design.get("control", ["Standard"]),
-                    "treatment_levels": existing_design.get("treatment", ["Standard"])
-                    if exp_num == 1
-                    else existing_design.get("treatment", ["Standard"]),
+                    "independent_variable": independent,
+                    "dependent_variable": dependent,
+                    "control_levels": control,
+                    "treatment_levels": treatment,
                 },
-                "dataset": feasibility.get("data", "available"),
-                "sample_size": "1000" if feasibility.get("data", "available") else 100,
-                "metrics": existing_design.get("metrics", ["accuracy", "F1"])
-                if exp_num == 1
-                else existing_design.get("metrics", ["accuracy", "F1"]),
-                "statistical_tests": existing_design.get(
-                    "statistics", ["paired t-test"]
-                )
-                if exp_num == 1
-                else existing_design.get("statistics", ["paired t-test"]),
+                "dataset": dataset,
+                "sample_size": sample_size,
+                "metrics": metrics,
+                "statistical_tests": statistics,
                 "significance_level": 0.05,
             }
-
-            experiment_designs.append(exp_design)
+            for exp_num in range(1, 4)
+        ]
 
         experiments.append(
             {"hypothesis_id": hypothesis_id, "experiment_designs": experiment_designs}
@@ -353,6 +415,41 @@ def design_experiments(
     return experiments
 
 
+# Feasibility score keys, in the column order used by score_feasibility
+_SCORE_KEYS = ("data_score", "method_score", "resources_score", "validation_score")
+
+
+def score_feasibility(
+    feasibilities: List[Dict[str, Any]]
+) -> Tuple[List[float], List[str]]:
+    """Compute overall feasibility and priority for a batch of hypotheses.
+
+    Overall feasibility is the mean of the four scores (missing scores count
+    as 0). Priority is "high" when the data, method and resources scores
+    reach 5, 7 and 6, and "medium" otherwise.
+
+    Args:
+        feasibilities: Feasibility dictionaries, one per hypothesis
+
+    Returns:
+        Tuple of (overall feasibility list, priority list)
+    """
+    rows = [[f.get(key, 0) for key in _SCORE_KEYS] for f in feasibilities]
+
+    if np is not None and rows:
+        scores = np.array(rows, dtype=np.float64)
+        overall = scores.sum(axis=1) / 4
+        high = (scores[:, 0] >= 5) & (scores[:, 1] >= 7) & (scores[:, 2] >= 6)
+        return overall.tolist(), np.where(high, "high", "medium").tolist()
+
+    overall = [sum(row) / 4 for row in rows]
+    priority = [
+        "high" if row[0] >= 5 and row[1] >= 7 and row[2] >= 6 else "medium"
+        for row in rows
+    ]
+    return overall, priority
+
+
 def generate_output(
     hypotheses: List[Dict[str, Any]],
     research_gap: str,
@@ -370,10 +467,13 @@ def generate_output(
     """
     formatted_hypotheses = []
 
-    for hypothesis in hypotheses:
+    feasibilities = [hypothesis.get("feasibility", {}) for hypothesis in hypotheses]
+    overall, priority = score_feasibility(feasibilities)
+
+    for i, hypothesis in enumerate(hypotheses):
         hypothesis_id = hypothesis["id"]
         variables = hypothesis.get("variables", {})
-        feasibility = hypothesis.get("feasibility", {})
+        feasibility = feasibilities[i]
 
         formatted_hypothesis = {
             "id": hypothesis_id,
@@ -389,20 +489,8 @@ def generate_output(
                 "validation": feasibility.get("validation", "unknown"),
             },
             "experiment_designs": hypothesis.get("experiment_design", {}),
-            "overall_feasibility": (
-                feasibility.get("data_score", 0)
-                + feasibility.get("method_score", 0)
-                + feasibility.get("resources_score", 0)
-                + feasibility.get("validation_score", 0)
-            )
-            / 4,
-            "priority": "high"
-            if (
-                feasibility.get("data_score", 0) >= 5
-                and feasibility.get("method_score", 0) >= 7
-                and feasibility.get("resources_score", 0) >= 6
-            )
-            else "medium",
+            "overall_feasibility": overall[i],
+            "priority": priority[i],
         }
 
         formatted_hypotheses.append(formatted_hypothesis)
@@ -436,6 +524,9 @@ def load_context(context_file: str) -> Dict[str, Any]:
         json.JSONDecodeError: If file is invalid JSON
     """
     try:
+        if orjson is not None:
+            with open(context_file, "rb") as f:
+                return orjson.loads(f.read())
         with open(context_file, "r", encoding="utf-8") as f:
             context = json.load(f)
             return context
@@ -445,6 +536,28 @@ def load_context(context_file: str) -> Dict[str, Any]:
         raise json.JSONDecodeError(f"Invalid JSON in context file: {e}")
 
 
+def _dumps(obj: Any, pretty: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    text = json.dumps(obj, indent=2 if pretty else None, ensure_ascii=False)
+    return text.encode("utf-8")
+
+
+def write_output(
+    output: Dict[str, Any], output_file: str, pretty: bool = False
+) -> None:
+    """Write the output document to output_file as UTF-8 JSON.
+
+    Args:
+        output: Document built by generate_output
+        output_file: Path of the JSON file to write
+        pretty: Indent the output by two spaces per level
+    """
+    with open(output_file, "wb") as f:
+        f.write(_dumps(output, pretty))
+
+
 def main():
     """CLI interface for hypothesis generator."""
     parser = argparse.ArgumentParser(
@@ -487,21 +600,10 @@ def main():
             key_papers = lr_stage.get("key_papers", [])
 
         hypotheses = generate_hypotheses(research_gap, context)
+        experiments = design_experiments(hypotheses)
+        output = generate_output(hypotheses, research_gap, experiments)
 
-        output = {
-            "research_gap": research_gap,
-            "hypotheses": hypotheses["hypotheses"],
-            "experiments": hypotheses["experiments"],
-            "recommended_directions": hypotheses["recommended_directions"],
-            "total_hypotheses": hypotheses["total_hypotheses"],
-            "generation_timestamp": hypotheses["generation_timestamp"],
-        }
-
-        with open(args.output, "w", encoding="utf-8") as f:
-            if args.pretty:
-                json.dump(output, f, indent=2, ensure_ascii=False)
-            else:
-                json.dump(output, f, ensure_ascii=False)
+        write_output(output, args.output, args.pretty)
 
         print(f"✓ Generated {len(output['hypotheses'])} hypotheses")
         print(f"  Research gap: {len(output['research_gap'])} chars")
@@ -3,18 +3,267 @@ arXiv API Search
 
 Usage:
     python arxiv-search.py "transformer attention" --max-results 10
+    python arxiv-search.py "transformer attention" "state space models"
 """
 
 import argparse
+import asyncio
+import contextlib
+import gzip
+import hashlib
+import io
+import os
+import threading
+import time
 import urllib.request
 import urllib.parse
 import xml.etree.ElementTree as ET
-from typing import List, Dict
+from pathlib import Path
+from typing import List, Dict, Optional
 
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
 
-def search_arxiv(query: str, max_results: int = 10) -> List[Dict]:
-    """Search arXiv API and return results."""
-    base_url = "http://export.arxiv.org/api/query"
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+API_URL = "http://export.arxiv.org/api/query"
+
+# Requests kept in flight at once when searching several queries
+MAX_CONCURRENT_REQUESTS = 3
+
+# Minimum seconds between the starts of two API requests from this process;
+# arXiv's API terms allow one request every three seconds
+REQUEST_INTERVAL = 3
+
+CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "paperpilot"
+)
+
+# Seconds a cached API response is reused before it is fetched again
+CACHE_TTL = 24 * 60 * 60
+
+# Clark-notation tags of the Atom elements read from each entry
+ATOM_NS = "http://www.w3.org/2005/Atom"
+ATOM = "{" + ATOM_NS + "}"
+ENTRY = ATOM + "entry"
+TITLE = ATOM + "title"
+SUMMARY = ATOM + "summary"
+PUBLISHED = ATOM + "published"
+AUTHOR = ATOM + "author"
+NAME = ATOM + "name"
+LINK = ATOM + "link"
+
+if etree is not None:
+    # Compiled once; evaluated in C for each entry
+    _NAMESPACES = {"atom": ATOM_NS}
+    _TEXT_FIELDS = etree.XPath(
+        "atom:title | atom:summary | atom:published", namespaces=_NAMESPACES
+    )
+    _AUTHOR_NAMES = etree.XPath(
+        "atom:author/atom:name/text()", namespaces=_NAMESPACES, smart_strings=False
+    )
+    _PDF_HREF = etree.XPath(
+        "atom:link[@title='pdf']/@href", namespaces=_NAMESPACES, smart_strings=False
+    )
+
+
+def _iter_entries(source):
+    """Yield each Atom <entry> element of a feed as soon as it is parsed.
+
+    Entries are cleared once the caller moves on, so memory stays bounded
+    by one entry rather than the whole feed.
+    """
+    if etree is not None:
+        for _, entry in etree.iterparse(source, events=("end",), tag=ENTRY):
+            yield entry
+            entry.clear()
+            # Drop the already-processed siblings still attached to <feed>
+            while entry.getprevious() is not None:
+                del entry.getparent()[0]
+        return
+
+    for _, elem in ET.iterparse(source, events=("end",)):
+        if elem.tag == ENTRY:
+            yield elem
+            elem.clear()
+
+
+def _pdf_url(entry) -> Optional[str]:
+    """Return the href of an entry's PDF link, or None if it has none."""
+    if etree is not None:
+        hrefs = _PDF_HREF(entry)
+        return hrefs[0] if hrefs else None
+    for link in entry.iterfind(LINK):
+        if link.get("title") == "pdf":
+            return link.get("href")
+    return None
+
+
+def _parse_entry(entry) -> Dict:
+    """Build the result dict for one Atom <entry> element."""
+    if etree is not None:
+        # One XPath pass for the text fields, keyed by tag since their
+        # order in the feed is not fixed
+        fields = {element.tag: element.text for element in _TEXT_FIELDS(entry)}
+        title, summary = fields.get(TITLE), fields.get(SUMMARY)
+        published = fields.get(PUBLISHED)
+        authors = _AUTHOR_NAMES(entry)
+    else:
+        title = entry.find(TITLE).text
+        summary = entry.find(SUMMARY).text
+        published = entry.find(PUBLISHED).text
+        authors = [a.find(NAME).text for a in entry.iterfind(AUTHOR)]
+
+    return {
+        "title": title.strip(),
+        "summary": summary.strip(),
+        "published": published,
+        "authors": authors,
+        "pdf_url": _pdf_url(entry),
+    }
+
+
+def _cache_file(url: str) -> Path:
+    """Return the on-disk cache location for an API response."""
+    digest = hashlib.blake2b(url.encode("utf-8"), digest_size=16).hexdigest()
+    return CACHE_DIR / f"{digest}.xml.gz"
+
+
+class _Throttle:
+    """Space out calls to wait() by at least `interval` seconds.
+
+    wait() and wait_async() draw from the same schedule, so threaded and
+    asyncio requests in one process share the limit.
+    """
+
+    def __init__(self, interval: float):
+        self._interval = interval
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def _reserve(self) -> float:
+        """Claim the next free slot and return the seconds until it starts."""
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next - now
+            self._next = max(now, self._next) + self._interval
+        return delay
+
+    def wait(self) -> None:
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def wait_async(self) -> None:
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+_throttle = _Throttle(REQUEST_INTERVAL)
+
+
+def _is_fresh(cache_file: Path) -> bool:
+    """Return whether cache_file exists and is younger than CACHE_TTL."""
+    try:
+        return time.time() - cache_file.stat().st_mtime < CACHE_TTL
+    except OSError:
+        return False
+
+
+def _read_cache(url: str) -> Optional[bytes]:
+    """Return the cached response body for url, or None if not fresh."""
+    cache_file = _cache_file(url)
+    if not _is_fresh(cache_file):
+        return None
+    try:
+        with gzip.open(cache_file, "rb") as cached:
+            return cached.read()
+    except OSError:
+        return None
+
+
+def _write_cache(url: str, data: bytes) -> None:
+    """Store a response body in the cache, ignoring filesystem errors."""
+    cache_file = _cache_file(url)
+    tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with gzip.open(tmp_file, "wb") as f:
+            f.write(data)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        with contextlib.suppress(OSError):
+            tmp_file.unlink()
+
+
+class _CachingReader:
+    """File-like wrapper that copies everything read into another file."""
+
+    def __init__(self, source, sink):
+        self._source = source
+        self._sink = sink
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._source.read(size)
+        self._sink.write(data)
+        return data
+
+
+@contextlib.contextmanager
+def _open_feed(url: str, use_cache: bool = True):
+    """Yield a file object over the response body for url.
+
+    Responses are kept gzip-compressed under CACHE_DIR and reused for
+    CACHE_TTL seconds. A fetched response is written to the cache as it
+    is read, so parsing still overlaps the download.
+    """
+    cache_file = _cache_file(url)
+    if use_cache and _is_fresh(cache_file):
+        with gzip.open(cache_file, "rb") as cached:
+            yield cached
+        return
+
+    request = urllib.request.Request(url, headers={"Accept-Encoding": "gzip"})
+    _throttle.wait()
+    with urllib.request.urlopen(request) as response:
+        source = response
+        if response.headers.get("Content-Encoding") == "gzip":
+            source = gzip.GzipFile(fileobj=response)
+
+        sink = None
+        if use_cache:
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            try:
+                CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                sink = gzip.open(tmp_file, "wb")
+            except OSError:
+                pass
+        if sink is None:
+            yield source
+            return
+
+        try:
+            reader = _CachingReader(source, sink)
+            yield reader
+            # Cache the complete body even if the parser stopped early
+            while reader.read(64 * 1024):
+                pass
+            sink.close()
+            os.replace(tmp_file, cache_file)
+        finally:
+            sink.close()
+            with contextlib.suppress(OSError):
+                tmp_file.unlink()
+
+
+def _query_url(query: str, max_results: int) -> str:
+    """Build the API URL for a query."""
     params = {
         "search_query": f"all:{query}",
         "start": 0,
@@ -22,41 +271,83 @@ def search_arxiv(query: str, max_results: int = 10) -> List[Dict]:
         "sortBy": "relevance",
         "sortOrder": "descending",
     }
+    return f"{API_URL}?{urllib.parse.urlencode(params)}"
 
-    url = f"{base_url}?{urllib.parse.urlencode(params)}"
 
-    with urllib.request.urlopen(url) as response:
-        data = response.read()
+def search_arxiv(
+    query: str, max_results: int = 10, use_cache: bool = True
+) -> List[Dict]:
+    """Search arXiv API and return results.
+
+    Args:
+        query: Search query
+        max_results: Maximum number of entries to return
+        use_cache: Reuse a cached response for the same request made within
+            CACHE_TTL, and cache the new response otherwise
+    """
+    url = _query_url(query, max_results)
 
-    root = ET.fromstring(data)
     results = []
 
-    for entry in root.findall("{http://www.w3.org/2005/Atom}entry"):
-        result = {
-            "title": entry.find("{http://www.w3.org/2005/Atom}title").text.strip(),
-            "summary": entry.find("{http://www.w3.org/2005/Atom}summary").text.strip(),
-            "published": entry.find("{http://www.w3.org/2005/Atom}published").text,
-            "authors": [
-                a.find("{http://www.w3.org/2005/Atom}name").text
-                for a in entry.findall("{http://www.w3.org/2005/Atom}author")
-            ],
-            "pdf_url": entry.find(
-                "{http://www.w3.org/2005/Atom}link[@title='pdf']"
-            ).attrib["href"],
-        }
-        results.append(result)
+    # Parse entries while the rest of the feed is still arriving
+    with _open_feed(url, use_cache) as source:
+        for entry in _iter_entries(source):
+            results.append(_parse_entry(entry))
 
     return results
 
 
-def main():
-    parser = argparse.ArgumentParser(description="Search arXiv")
-    parser.add_argument("query", help="Search query")
-    parser.add_argument("--max-results", type=int, default=10)
-    args = parser.parse_args()
+async def search_arxiv_async(
+    session, query: str, max_results: int = 10, use_cache: bool = True
+) -> List[Dict]:
+    """Asynchronous search_arxiv on a shared aiohttp.ClientSession."""
+    url = _query_url(query, max_results)
 
-    results = search_arxiv(args.query, args.max_results)
+    data = _read_cache(url) if use_cache else None
+    if data is None:
+        await _throttle.wait_async()
+        async with session.get(url) as response:
+            response.raise_for_status()
+            data = await response.read()
+        if use_cache:
+            _write_cache(url, data)
 
+    return [_parse_entry(entry) for entry in _iter_entries(io.BytesIO(data))]
+
+
+async def _search_arxiv_many_async(
+    queries: List[str], max_results: int, use_cache: bool
+) -> List[List[Dict]]:
+    """Run searches concurrently on one aiohttp session, in query order."""
+    connector = aiohttp.TCPConnector(limit=MAX_CONCURRENT_REQUESTS)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        return await asyncio.gather(
+            *[
+                search_arxiv_async(session, query, max_results, use_cache)
+                for query in queries
+            ]
+        )
+
+
+def search_arxiv_many(
+    queries: List[str], max_results: int = 10, use_cache: bool = True
+) -> Dict[str, List[Dict]]:
+    """Search arXiv for several queries, returning results keyed by query.
+
+    With aiohttp installed the requests overlap on one event loop;
+    otherwise the queries run one after another.
+    """
+    if aiohttp is None:
+        return {
+            query: search_arxiv(query, max_results, use_cache) for query in queries
+        }
+
+    results = asyncio.run(_search_arxiv_many_async(queries, max_results, use_cache))
+    return dict(zip(queries, results))
+
+
+def print_results(results: List[Dict]) -> None:
+    """Print search results to the console."""
     for i, r in enumerate(results, 1):
         print(f"\n[{i}] {r['title']}")
         print(f"    Published: {r['published'][:10]}")
@@ -64,5 +355,29 @@ def main():
         print(f"    PDF: {r['pdf_url']}")
 
 
+def main():
+    parser = argparse.ArgumentParser(description="Search arXiv")
+    parser.add_argument(
+        "query", nargs="+", help="Search query; several queries run concurrently"
+    )
+    parser.add_argument("--max-results", type=int, default=10)
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always query the API instead of reusing a response cached "
+        "within the last 24 hours",
+    )
+    args = parser.parse_args()
+
+    if len(args.query) == 1:
+        print_results(search_arxiv(args.query[0], args.max_results, not args.no_cache))
+        return
+
+    results = search_arxiv_many(args.query, args.max_results, not args.no_cache)
+    for query, query_results in results.items():
+        print(f"\n=== {query} ===")
+        print_results(query_results)
+
+
 if __name__ == "__main__":
     main()
@@ -5,9 +5,24 @@ Extract citations from PDF papers.
 """
 
 import re
-from typing import List, Dict
+from typing import Dict, Iterator, List, Tuple
 import sys
 
+# Citation, reference-section and BibTeX patterns, compiled once at import.
+_NUMBERED_RE = re.compile(r"\[\d+(?:[-,]\d+)*\]")
+_AUTHOR_YEAR_RE = re.compile(r"\([A-Z][a-z]+(?:\s+et\s+al\.)?,\s*\d{4}\)")
+_REF_SECTION_RES = [
+    re.compile(pattern, re.DOTALL | re.IGNORECASE)
+    for pattern in (
+        r"References\n(.+)",
+        r"Bibliography\n(.+)",
+        r"References\s*\n={3,}\n(.+)",
+    )
+]
+_BIB_TYPE_RE = re.compile(r"@(\w+)\{")
+_BIB_KEY_RE = re.compile(r"@\w+\{([^,]+),")
+_BIB_FIELD_START_RE = re.compile(r"(\w+)\s*=\s*\{")
+
 
 def extract_citations(text: str) -> List[str]:
     """Extract citation patterns from text.
@@ -18,48 +33,70 @@ def extract_citations(text: str) -> List[str]:
     - (Smith, 2020)
     """
     # Numbered citations [1], [2,3], [1-5]
-    numbered = re.findall(r"\[\d+(?:[-,]\d+)*\]", text)
+    numbered = _NUMBERED_RE.findall(text)
 
     # Author-year citations (Smith, 2020) or (Smith et al., 2020)
-    author_year = re.findall(r"\([A-Z][a-z]+(?:\s+et\s+al\.)?,\s*\d{4}\)", text)
+    author_year = _AUTHOR_YEAR_RE.findall(text)
 
     return numbered + author_year
 
 
 def extract_references_section(text: str) -> str:
     """Extract the references/bibliography section."""
-    patterns = [
-        r"References\n(.+)",
-        r"Bibliography\n(.+)",
-        r"References\s*\n={3,}\n(.+)",
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
+    for pattern in _REF_SECTION_RES:
+        match = pattern.search(text)
         if match:
             return match.group(1)
 
     return ""
 
 
+def _scan_fields(entry: str) -> Iterator[Tuple[str, str]]:
+    """Yield (name, value) for each ``name = {value}`` field of an entry.
+
+    Values may contain nested braces, e.g. ``title = {A {GPU} Study}``:
+    the value runs to the brace that brings the depth back to zero, and
+    only the outer pair is stripped.
+    """
+    pos = 0
+    while True:
+        match = _BIB_FIELD_START_RE.search(entry, pos)
+        if match is None:
+            return
+        start = pos = match.end()
+        depth = 1
+        # Jump between braces rather than stepping through every character
+        while depth:
+            close = entry.find("}", pos)
+            if close == -1:
+                return  # Unterminated value
+            open_ = entry.find("{", pos, close)
+            if open_ == -1:
+                depth -= 1
+                pos = close + 1
+            else:
+                depth += 1
+                pos = open_ + 1
+        yield match.group(1), entry[start : pos - 1]
+
+
 def parse_bibtex_entry(entry: str) -> Dict:
     """Parse a single BibTeX entry."""
     result = {}
 
     # Extract type
-    type_match = re.match(r"@(\w+)\{", entry)
+    type_match = _BIB_TYPE_RE.match(entry)
     if type_match:
         result["type"] = type_match.group(1)
 
     # Extract key
-    key_match = re.search(r"@\w+\{([^,]+),", entry)
+    key_match = _BIB_KEY_RE.search(entry)
     if key_match:
         result["key"] = key_match.group(1)
 
     # Extract fields
-    field_pattern = r"(\w+)\s*=\s*\{([^}]*)\}"
-    for match in re.finditer(field_pattern, entry):
-        result[match.group(1)] = match.group(2)
+    for name, value in _scan_fields(entry):
+        result[name] = value
 
     return result
 
@@ -9,26 +9,250 @@ Usage:
 """
 
 import argparse
+import asyncio
+import contextlib
+import gzip
+import hashlib
 import json
+import os
+import threading
+import time
 import urllib.request
 import urllib.parse
 import urllib.error
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import urllib3
+except ImportError:
+    urllib3 = None
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
 
 # NCBI E-utilities base URL
 EUTILS_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
 
+CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "paperpilot"
+)
+
+# Seconds a cached API response is reused before it is fetched again
+CACHE_TTL = 24 * 60 * 60
+
+# IDs per ESummary request, as recommended by NCBI for batch retrieval
+ESUMMARY_BATCH_SIZE = 200
+
+# Concurrent ESummary requests; the request rate is capped separately by
+# REQUEST_INTERVAL.
+ESUMMARY_WORKERS = 3
+
+# Minimum seconds between E-utilities requests from this process; NCBI
+# allows 3 requests/second without an API key and 10 with one.
+REQUEST_INTERVAL = 1 / 10 if os.environ.get("NCBI_API_KEY") else 1 / 3
+
+# Keep-alive connections shared by the ESearch and ESummary requests, so
+# they reuse one TLS session instead of a new handshake per request.
+_POOL = None
+if urllib3 is not None:
+    _POOL = urllib3.PoolManager(
+        maxsize=ESUMMARY_WORKERS,
+        retries=urllib3.Retry(
+            total=3, backoff_factor=0.5, status_forcelist=(429, 502, 503, 504)
+        ),
+    )
+
+
+def _with_api_key(params: Dict) -> Dict:
+    """Add the NCBI_API_KEY environment variable to request params, if set."""
+    api_key = os.environ.get("NCBI_API_KEY")
+    if api_key:
+        return {**params, "api_key": api_key}
+    return params
 
-def search_pubmed(
-    query: str,
-    max_results: int = 10,
-    db: str = "pubmed",
-    retmode: str = "json",
-) -> Dict:
-    """Search PubMed using E-utilities ESearch."""
 
+def _loads(data: bytes) -> Any:
+    """Parse a UTF-8 JSON response body, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode("utf-8"))
+
+
+def _cache_file(url: str) -> Path:
+    """Return the on-disk cache location for an API response."""
+    digest = hashlib.blake2b(url.encode("utf-8"), digest_size=16).hexdigest()
+    return CACHE_DIR / f"{digest}.json.gz"
+
+
+def _is_fresh(cache_file: Path) -> bool:
+    """Return whether cache_file exists and is younger than CACHE_TTL."""
+    try:
+        return time.time() - cache_file.stat().st_mtime < CACHE_TTL
+    except OSError:
+        return False
+
+
+def _read_cache(url: str) -> Optional[bytes]:
+    """Return the cached response body for url, or None if not fresh."""
+    cache_file = _cache_file(url)
+    if not _is_fresh(cache_file):
+        return None
+    try:
+        with gzip.open(cache_file, "rb") as cached:
+            return cached.read()
+    except OSError:
+        return None
+
+
+def _write_cache(url: str, data: bytes) -> None:
+    """Store a response body in the cache, ignoring filesystem errors."""
+    cache_file = _cache_file(url)
+    tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with gzip.open(tmp_file, "wb") as f:
+            f.write(data)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        with contextlib.suppress(OSError):
+            tmp_file.unlink()
+
+
+class _Throttle:
+    """Space out calls to wait() by at least `interval` seconds.
+
+    wait() and wait_async() draw from the same schedule, so threaded and
+    asyncio requests in one process share the limit.
+    """
+
+    def __init__(self, interval: float):
+        self._interval = interval
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def _reserve(self) -> float:
+        """Claim the next free slot and return the seconds until it starts."""
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next - now
+            self._next = max(now, self._next) + self._interval
+        return delay
+
+    def wait(self) -> None:
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def wait_async(self) -> None:
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+_throttle = _Throttle(REQUEST_INTERVAL)
+
+
+class _CachingReader:
+    """File-like wrapper that copies everything read into another file."""
+
+    def __init__(self, source, sink):
+        self._source = source
+        self._sink = sink
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._source.read(size)
+        self._sink.write(data)
+        return data
+
+
+@contextlib.contextmanager
+def _request(url: str):
+    """Yield a file object over the decompressed body of a GET request."""
+    headers = {"Accept-Encoding": "gzip"}
+    _throttle.wait()
+    if _POOL is not None:
+        try:
+            response = _POOL.request(
+                "GET", url, headers=headers, timeout=30, preload_content=False
+            )
+        except urllib3.exceptions.HTTPError as e:
+            raise RuntimeError(f"Connection Error: {e}")
+        try:
+            if response.status >= 400:
+                raise RuntimeError(f"HTTP Error {response.status}: {response.reason}")
+            yield response
+        finally:
+            # Hand the connection back to the pool for the next request
+            response.drain_conn()
+            response.release_conn()
+        return
+
+    request = urllib.request.Request(url, headers=headers)
+    with urllib.request.urlopen(request, timeout=30) as response:
+        if response.headers.get("Content-Encoding") == "gzip":
+            yield gzip.GzipFile(fileobj=response)
+        else:
+            yield response
+
+
+@contextlib.contextmanager
+def _open_url(url: str, use_cache: bool = True):
+    """Yield a file object over the decompressed response body for url.
+
+    Responses are kept gzip-compressed under CACHE_DIR and reused for
+    CACHE_TTL seconds. A fetched response is written to the cache as it
+    is read, so parsing still overlaps the download.
+    """
+    cache_file = _cache_file(url)
+    if use_cache and _is_fresh(cache_file):
+        with gzip.open(cache_file, "rb") as cached:
+            yield cached
+        return
+
+    with _request(url) as source:
+        sink = None
+        if use_cache:
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            try:
+                CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                sink = gzip.open(tmp_file, "wb")
+            except OSError:
+                pass
+        if sink is None:
+            yield source
+            return
+
+        try:
+            reader = _CachingReader(source, sink)
+            yield reader
+            # Cache the complete body even if the parser stopped early
+            while reader.read(64 * 1024):
+                pass
+            sink.close()
+            os.replace(tmp_file, cache_file)
+        finally:
+            sink.close()
+            with contextlib.suppress(OSError):
+                tmp_file.unlink()
+
+
+def _esearch_url(query: str, max_results: int, db: str, retmode: str) -> str:
+    """Build the ESearch URL for a query."""
     params = {
         "db": db,
         "term": query,
@@ -36,12 +260,64 @@ def search_pubmed(
         "retmax": max_results,
         "sort": "relevance",
     }
+    return f"{EUTILS_URL}/esearch.fcgi?{urllib.parse.urlencode(_with_api_key(params))}"
+
+
+def _esummary_url(id_list: List[str], db: str) -> str:
+    """Build the ESummary URL for one batch of PubMed IDs."""
+    params = {
+        "db": db,
+        "id": ",".join(id_list),
+        "retmode": "json",
+    }
+    return f"{EUTILS_URL}/esummary.fcgi?{urllib.parse.urlencode(_with_api_key(params))}"
+
+
+def _batches(id_list: List[str]) -> List[List[str]]:
+    """Split IDs into ESummary requests of ESUMMARY_BATCH_SIZE."""
+    return [
+        id_list[i : i + ESUMMARY_BATCH_SIZE]
+        for i in range(0, len(id_list), ESUMMARY_BATCH_SIZE)
+    ]
+
+
+def _papers_from_summaries(id_list: List[str], result_list: Dict) -> List[Dict]:
+    """Build paper records in id_list order from an ESummary result mapping."""
+    papers = []
 
-    url = f"{EUTILS_URL}/esearch.fcgi?{urllib.parse.urlencode(params)}"
+    for pmid in id_list:
+        item = result_list.get(pmid)
+        if item is None:
+            continue
+        title = item.get("title", "")
+        paper = {
+            "pmid": pmid,
+            "title": title,
+            "authors": item.get("authors", []),
+            "source": item.get("source", ""),
+            "pubdate": item.get("pubdate", ""),
+            "doi": item.get("elocationid", "").replace("doi: ", ""),
+            "abstract": title,  # Summary doesn't include abstract
+        }
+        papers.append(paper)
+
+    return papers
+
+
+def search_pubmed(
+    query: str,
+    max_results: int = 10,
+    db: str = "pubmed",
+    retmode: str = "json",
+    use_cache: bool = True,
+) -> Dict:
+    """Search PubMed using E-utilities ESearch."""
+
+    url = _esearch_url(query, max_results, db, retmode)
 
     try:
-        with urllib.request.urlopen(url, timeout=30) as response:
-            data = json.loads(response.read().decode("utf-8"))
+        with _open_url(url, use_cache) as body:
+            data = _loads(body.read())
         return data.get("esearchresult", {})
     except urllib.error.HTTPError as e:
         raise RuntimeError(f"HTTP Error {e.code}: {e.reason}")
@@ -51,44 +327,49 @@ def search_pubmed(
         raise RuntimeError("Failed to parse PubMed response")
 
 
-def fetch_details(id_list: List[str], db: str = "pubmed") -> List[Dict]:
-    """Fetch detailed information for PubMed IDs using ESummary."""
+def _fetch_summaries(
+    id_list: List[str], db: str = "pubmed", use_cache: bool = True
+) -> Dict:
+    """Fetch the ESummary "result" mapping for one batch of PubMed IDs."""
+
+    url = _esummary_url(id_list, db)
+
+    with _open_url(url, use_cache) as body:
+        if ijson is not None:
+            # Decode the summaries while the response is still arriving
+            return dict(ijson.kvitems(body, "result", use_float=True))
+        data = _loads(body.read())
+    return data.get("result", {})
+
+
+def fetch_details(
+    id_list: List[str], db: str = "pubmed", use_cache: bool = True
+) -> List[Dict]:
+    """Fetch detailed information for PubMed IDs using ESummary.
+
+    IDs are requested in batches of ESUMMARY_BATCH_SIZE, with up to
+    ESUMMARY_WORKERS batches in flight at once and requests started no
+    more often than REQUEST_INTERVAL allows.
+    """
 
     if not id_list:
         return []
 
-    params = {
-        "db": db,
-        "id": ",".join(id_list),
-        "retmode": "json",
-    }
-
-    url = f"{EUTILS_URL}/esummary.fcgi?{urllib.parse.urlencode(params)}"
+    batches = _batches(id_list)
 
     try:
-        with urllib.request.urlopen(url, timeout=30) as response:
-            data = json.loads(response.read().decode("utf-8"))
-
-        result_list = data.get("result", {})
-        papers = []
-
-        for pmid in id_list:
-            if pmid in result_list:
-                item = result_list[pmid]
-                paper = {
-                    "pmid": pmid,
-                    "title": item.get("title", ""),
-                    "authors": item.get("authors", []),
-                    "source": item.get("source", ""),
-                    "pubdate": item.get("pubdate", ""),
-                    "doi": item.get("elocationid", "").replace("doi: ", ""),
-                    "abstract": item.get(
-                        "title", ""
-                    ),  # Summary doesn't include abstract
-                }
-                papers.append(paper)
-
-        return papers
+        if len(batches) == 1:
+            result_list = _fetch_summaries(batches[0], db, use_cache)
+        else:
+            result_list = {}
+            workers = min(ESUMMARY_WORKERS, len(batches))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for result in executor.map(
+                    lambda batch: _fetch_summaries(batch, db, use_cache), batches
+                ):
+                    result_list.update(result)
+
+        return _papers_from_summaries(id_list, result_list)
     except Exception as e:
         raise RuntimeError(f"Failed to fetch details: {e}")
 
@@ -97,11 +378,12 @@ def search_pubmed_full(
     query: str,
     max_results: int = 10,
     include_details: bool = True,
+    use_cache: bool = True,
 ) -> List[Dict]:
     """Complete PubMed search with details."""
 
     # Step 1: Search for IDs
-    search_result = search_pubmed(query, max_results)
+    search_result = search_pubmed(query, max_results, use_cache=use_cache)
     id_list = search_result.get("IdList", [])
 
     if not id_list:
@@ -109,19 +391,122 @@ def search_pubmed_full(
 
     # Step 2: Fetch details if requested
     if include_details:
-        papers = fetch_details(id_list)
+        papers = fetch_details(id_list, use_cache=use_cache)
         return papers
 
     # Return minimal results with just IDs
     return [{"pmid": pmid} for pmid in id_list]
 
 
+async def _get_json_async(session, url: str, use_cache: bool = True) -> Any:
+    """GET a JSON E-utilities response through the cache with aiohttp."""
+    data = _read_cache(url) if use_cache else None
+    if data is None:
+        await _throttle.wait_async()
+        try:
+            async with session.get(url) as response:
+                response.raise_for_status()
+                data = await response.read()
+        except aiohttp.ClientResponseError as e:
+            raise RuntimeError(f"HTTP Error {e.status}: {e.message}")
+        except aiohttp.ClientError as e:
+            raise RuntimeError(f"Connection Error: {e}")
+        if use_cache:
+            _write_cache(url, data)
+    try:
+        return _loads(data)
+    except json.JSONDecodeError:
+        raise RuntimeError("Failed to parse PubMed response")
+
+
+async def search_pubmed_async(
+    session,
+    query: str,
+    max_results: int = 10,
+    include_details: bool = True,
+    use_cache: bool = True,
+    db: str = "pubmed",
+) -> List[Dict]:
+    """Asynchronous search_pubmed_full on a shared aiohttp.ClientSession."""
+
+    url = _esearch_url(query, max_results, db, "json")
+    search_result = await _get_json_async(session, url, use_cache)
+    id_list = search_result.get("esearchresult", {}).get("IdList", [])
+
+    if not id_list:
+        return []
+
+    if not include_details:
+        return [{"pmid": pmid} for pmid in id_list]
+
+    summaries = await asyncio.gather(
+        *[
+            _get_json_async(session, _esummary_url(batch, db), use_cache)
+            for batch in _batches(id_list)
+        ]
+    )
+    result_list = {}
+    for summary in summaries:
+        result_list.update(summary.get("result", {}))
+    return _papers_from_summaries(id_list, result_list)
+
+
+async def _search_pubmed_many_async(
+    queries: List[str], max_results: int, include_details: bool, use_cache: bool
+) -> List[List[Dict]]:
+    """Run searches concurrently on one aiohttp session, in query order."""
+    # At most ESUMMARY_WORKERS requests in flight, as with fetch_details
+    connector = aiohttp.TCPConnector(limit=ESUMMARY_WORKERS)
+    timeout = aiohttp.ClientTimeout(total=30)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        return await asyncio.gather(
+            *[
+                search_pubmed_async(
+                    session, query, max_results, include_details, use_cache
+                )
+                for query in queries
+            ]
+        )
+
+
+def search_pubmed_many(
+    queries: List[str],
+    max_results: int = 10,
+    include_details: bool = True,
+    use_cache: bool = True,
+) -> Dict[str, List[Dict]]:
+    """Run several complete PubMed searches, keyed by query.
+
+    With aiohttp installed the searches share one event loop, so their
+    requests overlap; otherwise they run one after another.
+    """
+    if aiohttp is None:
+        return {
+            query: search_pubmed_full(query, max_results, include_details, use_cache)
+            for query in queries
+        }
+
+    results = asyncio.run(
+        _search_pubmed_many_async(queries, max_results, include_details, use_cache)
+    )
+    return dict(zip(queries, results))
+
+
+def _write_json(obj: Any, output_file: str) -> None:
+    """Write obj to output_file as indented UTF-8 JSON."""
+    if orjson is not None:
+        with open(output_file, "wb") as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, "w", encoding="utf-8") as f:
+            json.dump(obj, f, indent=2, ensure_ascii=False)
+
+
 def output_results(papers: List[Dict], output_file: Optional[str] = None) -> None:
     """Output results to file or console."""
 
     if output_file:
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(papers, f, indent=2, ensure_ascii=False)
+        _write_json(papers, output_file)
         print(f"Results saved to: {output_file}")
     else:
         for i, paper in enumerate(papers, 1):
@@ -142,12 +527,15 @@ def main():
 Examples:
     python pubmed-search.py "CRISPR gene editing"
     python pubmed-search.py "deep learning" --max-results 20 --output results.json
+    python pubmed-search.py "CRISPR" "base editing" --output results.json
         """,
     )
 
     parser.add_argument(
         "query",
-        help="Search query (supports PubMed syntax)",
+        nargs="+",
+        help="Search query (supports PubMed syntax); several queries run "
+        "concurrently",
     )
     parser.add_argument(
         "--max-results",
@@ -172,14 +560,40 @@ Examples:
         choices=["pubmed", "medline"],
         help="Database to search (default: pubmed)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always query the API instead of reusing responses cached "
+        "within the last 24 hours",
+    )
 
     args = parser.parse_args()
 
     try:
+        if len(args.query) > 1:
+            results = search_pubmed_many(
+                args.query,
+                max_results=args.max_results,
+                include_details=not args.ids_only,
+                use_cache=not args.no_cache,
+            )
+            if args.output:
+                _write_json(results, args.output)
+                print(f"Results saved to: {args.output}")
+                return
+            for query, papers in results.items():
+                print(f"\n=== {query} ===")
+                if papers:
+                    output_results(papers)
+                else:
+                    print("No results found.")
+            return
+
         papers = search_pubmed_full(
-            args.query,
+            args.query[0],
             max_results=args.max_results,
             include_details=not args.ids_only,
+            use_cache=not args.no_cache,
         )
 
         if not papers:
@@ -7,11 +7,18 @@ identifies research gaps, and produces structured output for hypothesis generati
 """
 
 import argparse
+import heapq
 import json
 import sys
+from itertools import islice
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def synthesize_summary(papers: List[Dict[str, Any]]) -> str:
     """Synthesize a 2-3 paragraph summary from analyzed papers.
@@ -27,12 +34,9 @@ def synthesize_summary(papers: List[Dict[str, Any]]) -> str:
 
     themes = {}
     for paper in papers:
-        method = paper.get("method", "").lower()
-        if not method:
-            method = paper.get("summary", "").split(" ")[0].lower()
-        if method not in themes:
-            themes[method] = []
-        themes[method].append(paper)
+        # Only the first word of the summary is needed, so split once
+        method = paper.get("method") or paper.get("summary", "").split(" ", 1)[0]
+        themes.setdefault(method.lower(), []).append(paper)
 
     summary_parts = []
 
@@ -70,12 +74,10 @@ def identify_research_gap(papers: List[Dict[str, Any]]) -> str:
         return "Insufficient papers to identify research gap (need at least 3)."
 
     limitations = []
+    future_work = []
     for paper in papers:
         if "limitation" in paper:
             limitations.append(paper["limitation"])
-
-    future_work = []
-    for paper in papers:
         if "future_work" in paper:
             future_work.append(paper["future_work"])
 
@@ -83,14 +85,16 @@ def identify_research_gap(papers: List[Dict[str, Any]]) -> str:
 
     if limitations:
         gap_parts.append(
-            f"While current approaches {', '.join(limitations[:2])}, "
-            f"these methods still face challenges in {', '.join(limitations[2:])}."
+            f"While current approaches {', '.join(islice(limitations, 2))}, "
+            "these methods still face challenges in "
+            f"{', '.join(islice(limitations, 2, None))}."
         )
 
     if future_work:
         gap_parts.append(
-            f"Recent work identifies opportunities in {', '.join(future_work[:2])}, "
-            f"but systematic exploration of {', '.join(future_work[2:])} remains limited."
+            "Recent work identifies opportunities in "
+            f"{', '.join(islice(future_work, 2))}, but systematic exploration of "
+            f"{', '.join(islice(future_work, 2, None))} remains limited."
         )
 
     gap_parts.append(
@@ -115,23 +119,24 @@ def generate_key_papers(papers: List[Dict[str, Any]], top_n: int = 10) -> List[D
     if not papers:
         return []
 
-    sorted_papers = sorted(
+    # Partial selection: no need to sort the papers that are not returned
+    key_papers = heapq.nlargest(
+        top_n,
         papers,
-        key=lambda x: (x.get("year", 2025), -len(x.get("citations", []))),
-        reverse=True
+        key=lambda x: (x.get("year", 2025), -len(x.get("citations", [])))
     )
 
-    key_papers = sorted_papers[:top_n]
-
     formatted = []
     for i, paper in enumerate(key_papers, 1):
+        get = paper.get
+        summary = get("summary")
         formatted.append({
             "id": f"P{i}",
-            "title": paper.get("title", "Unknown"),
-            "year": paper.get("year", "Unknown"),
-            "method": paper.get("method", "Unknown"),
-            "limitation": paper.get("limitation", "Not specified"),
-            "contribution": paper.get("summary", "").split(".")[0] + "." if paper.get("summary") else ""
+            "title": get("title", "Unknown"),
+            "year": get("year", "Unknown"),
+            "method": get("method", "Unknown"),
+            "limitation": get("limitation", "Not specified"),
+            "contribution": summary.split(".", 1)[0] + "." if summary else ""
         })
 
     return formatted
@@ -157,17 +162,18 @@ def generate_output(papers: List[Dict[str, Any]], query: str) -> Dict[str, Any]:
             methods.add(paper["method"].lower())
 
     recommended_directions = []
-    if "attention" in " ".join(methods):
+    # Substring checks per method, without joining them into one string
+    if any("attention" in method for method in methods):
         recommended_directions.append(
             "Investigate attention mechanisms for long-range dependency modeling"
         )
-    if "transformer" in " ".join(methods):
+    if any("transformer" in method for method in methods):
         recommended_directions.append(
             "Explore efficient transformer architectures for resource-constrained environments"
         )
     if len(methods) > 0:
         recommended_directions.append(
-            f"Combine strengths of {', '.join(list(methods)[:3])} methods"
+            f"Combine strengths of {', '.join(islice(methods, 3))} methods"
         )
 
     return {
@@ -180,6 +186,21 @@ def generate_output(papers: List[Dict[str, Any]], query: str) -> Dict[str, Any]:
     }
 
 
+def _loads(data: bytes) -> Any:
+    """Parse UTF-8 JSON, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode("utf-8"))
+
+
+def _dumps(obj: Any, pretty: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    text = json.dumps(obj, indent=2 if pretty else None, ensure_ascii=False)
+    return text.encode("utf-8")
+
+
 def load_papers_from_file(input_file: str) -> List[Dict[str, Any]]:
     """Load papers from JSON file.
 
@@ -194,13 +215,16 @@ def load_papers_from_file(input_file: str) -> List[Dict[str, Any]]:
         json.JSONDecodeError: If file is invalid JSON
     """
     try:
-        with open(input_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(input_file, "rb") as f:
+            data = _loads(f.read())
             return data.get("papers", [])
     except FileNotFoundError:
         raise FileNotFoundError(f"Input file not found: {input_file}")
     except json.JSONDecodeError as e:
-        raise json.JSONDecodeError(f"Invalid JSON in input file: {e}")
+        # Also catches orjson.JSONDecodeError, a subclass
+        raise json.JSONDecodeError(
+            f"Invalid JSON in input file: {e.msg}", e.doc, e.pos
+        )
 
 
 def main():
@@ -245,11 +269,8 @@ def main():
 
         output = generate_output(papers, args.query or "literature review")
 
-        with open(args.output, "w", encoding="utf-8") as f:
-            if args.pretty:
-                json.dump(output, f, indent=2, ensure_ascii=False)
-            else:
-                json.dump(output, f, ensure_ascii=False)
+        with open(args.output, "wb") as f:
+            f.write(_dumps(output, args.pretty))
 
         print(f"✓ Literature review generated: {args.output}")
         print(f"  Papers analyzed: {output['papers_analyzed']}")
@@ -12,24 +12,177 @@ API Key (optional):
 """
 
 import argparse
+import contextlib
+import gzip
+import hashlib
 import json
 import os
 import sys
+import threading
+import time
+import urllib.error
 import urllib.request
 import urllib.parse
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import urllib3
+except ImportError:
+    urllib3 = None
 
 
 # Semantic Scholar API base URL
 SEMANTIC_SCHOLAR_URL = "https://api.semanticscholar.org/graph/v1"
 
+# Requests a client keeps in flight at once, e.g. for a citation network
+MAX_CONCURRENT_REQUESTS = 3
+
+# Largest page the paper search endpoint returns per request
+PAGE_SIZE = 100
+
+# The relevance search endpoint only serves the first 1,000 results of a
+# query; offsets past that are rejected
+SEARCH_RESULT_LIMIT = 1000
+
+# Minimum seconds between the starts of two API requests from this process;
+# Semantic Scholar allows an API key 1 request/second, and keyless requests
+# draw on a pool shared by all users
+REQUEST_INTERVAL = 1.0
+
+# Retries of a rate-limited (429) request, and the base of the exponential
+# backoff in seconds when the response has no usable Retry-After header
+MAX_RETRIES = 3
+RETRY_BACKOFF = 1.0
+
+CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "paperpilot"
+)
+
+
+def _loads(data: bytes) -> Any:
+    """Parse a UTF-8 JSON response body, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode("utf-8"))
+
+
+def _write_json(obj: Any, output_file: str) -> None:
+    """Write obj to output_file as indented UTF-8 JSON."""
+    if orjson is not None:
+        with open(output_file, "wb") as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, "w", encoding="utf-8") as f:
+            json.dump(obj, f, indent=2)
+
+
+def _cache_file(url: str) -> Path:
+    """Return the on-disk cache location for an API response."""
+    digest = hashlib.blake2b(url.encode("utf-8"), digest_size=16).hexdigest()
+    return CACHE_DIR / f"{digest}.s2.gz"
+
+
+def _read_cache(url: str) -> Optional[Tuple[str, bytes]]:
+    """Return the cached (ETag, body) for url, or None if not cached.
+
+    The ETag is an empty string if the server did not send one.
+    """
+    try:
+        with gzip.open(_cache_file(url), "rb") as cached:
+            etag, _, body = cached.read().partition(b"\n")
+    except OSError:
+        return None
+    return etag.decode("latin-1"), body
+
+
+def _write_cache(url: str, etag: Optional[str], body: bytes) -> None:
+    """Store a response body and its ETag, ignoring filesystem errors."""
+    cache_file = _cache_file(url)
+    tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with gzip.open(tmp_file, "wb") as f:
+            f.write((etag or "").encode("latin-1") + b"\n" + body)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        with contextlib.suppress(OSError):
+            tmp_file.unlink()
+
+
+def _retry_delay(headers: Mapping[str, str], attempt: int) -> float:
+    """Return the seconds to wait before retrying a rate-limited request."""
+    try:
+        return max(0.0, float(headers.get("Retry-After")))
+    except (TypeError, ValueError):
+        return RETRY_BACKOFF * 2**attempt
+
+
+class _Throttle:
+    """Space out calls to wait() by at least `interval` seconds."""
+
+    def __init__(self, interval: float):
+        self._interval = interval
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next - now
+            self._next = max(now, self._next) + self._interval
+        if delay > 0:
+            time.sleep(delay)
+
+
+_throttle = _Throttle(REQUEST_INTERVAL)
+
 
 class SemanticScholarClient:
     """Client for Semantic Scholar API."""
 
-    def __init__(self, api_key: Optional[str] = None):
+    __slots__ = ("api_key", "base_url", "use_cache", "_pool")
+
+    def __init__(self, api_key: Optional[str] = None, use_cache: bool = True):
+        """Create a client.
+
+        Args:
+            api_key: Semantic Scholar API key; defaults to the
+                SEMANTIC_SCHOLAR_API_KEY environment variable
+            use_cache: Keep responses under CACHE_DIR and revalidate them
+                with If-None-Match, so unchanged results are not downloaded
+                again; a cached response is also used when rate limited
+        """
         self.api_key = api_key or os.environ.get("SEMANTIC_SCHOLAR_API_KEY")
         self.base_url = SEMANTIC_SCHOLAR_URL
+        self.use_cache = use_cache
+        # Keep-alive connections reused across requests, so only the first
+        # one pays for the TCP and TLS handshakes
+        self._pool = None
+        if urllib3 is not None:
+            # Rate limiting is retried by _make_request for both transports
+            self._pool = urllib3.PoolManager(
+                maxsize=MAX_CONCURRENT_REQUESTS,
+                retries=urllib3.Retry(3, respect_retry_after_header=False),
+            )
+
+    def close(self) -> None:
+        """Close the client's pooled connections."""
+        if self._pool is not None:
+            self._pool.clear()
+
+    def __enter__(self) -> "SemanticScholarClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def _make_request(
         self,
@@ -50,15 +203,60 @@ class SemanticScholarClient:
         if params:
             url += f"?{urllib.parse.urlencode(params)}"
 
+        cached = _read_cache(url) if self.use_cache else None
+        if cached is not None and cached[0]:
+            headers["If-None-Match"] = cached[0]
+
+        for attempt in range(MAX_RETRIES + 1):
+            _throttle.wait()
+            status, reason, response_headers, body = self._get(url, headers)
+            # With a cached copy to fall back on, do not wait out a 429
+            if status != 429 or cached is not None or attempt == MAX_RETRIES:
+                break
+            time.sleep(_retry_delay(response_headers, attempt))
+
+        if status == 304 and cached is not None:
+            # Unchanged since it was cached: the server sent no body
+            return _loads(cached[1])
+        if status == 429:
+            if cached is not None:
+                # Rate limited: a possibly stale response beats none
+                return _loads(cached[1])
+            raise RuntimeError("Rate limit exceeded. Consider using an API key.")
+        if status >= 400:
+            raise RuntimeError(f"HTTP Error {status}: {reason}")
+
+        if self.use_cache:
+            _write_cache(url, response_headers.get("ETag"), body)
+        return _loads(body)
+
+    def _get(
+        self, url: str, headers: Dict[str, str]
+    ) -> Tuple[int, str, Mapping[str, str], bytes]:
+        """Send a GET request and return (status, reason, headers, body).
+
+        HTTP error statuses are returned like any other; only connection
+        failures raise.
+        """
+        if self._pool is not None:
+            try:
+                response = self._pool.request("GET", url, headers=headers, timeout=30)
+            except urllib3.exceptions.HTTPError as e:
+                raise RuntimeError(f"Connection Error: {e}")
+            return response.status, response.reason, response.headers, response.data
+
         request = urllib.request.Request(url, headers=headers)
 
         try:
             with urllib.request.urlopen(request, timeout=30) as response:
-                return json.loads(response.read().decode("utf-8"))
+                return (
+                    response.status,
+                    response.reason,
+                    response.headers,
+                    response.read(),
+                )
         except urllib.error.HTTPError as e:
-            if e.code == 429:
-                raise RuntimeError("Rate limit exceeded. Consider using an API key.")
-            raise RuntimeError(f"HTTP Error {e.code}: {e.reason}")
+            return e.code, e.reason, e.headers, e.read()
         except urllib.error.URLError as e:
             raise RuntimeError(f"Connection Error: {e.reason}")
 
@@ -68,20 +266,47 @@ class SemanticScholarClient:
         max_results: int = 10,
         fields: Optional[str] = None,
     ) -> List[Dict]:
-        """Search for papers."""
+        """Search for papers.
+
+        At most SEARCH_RESULT_LIMIT results are returned. More than PAGE_SIZE
+        results are fetched as pages of PAGE_SIZE: the first page reports the
+        query's total, and only the pages within it are then requested, up
+        to MAX_CONCURRENT_REQUESTS at a time.
+        """
 
         if fields is None:
             fields = "title,authors,abstract,year,venue,citationCount,referenceCount,doi,fieldsOfStudy"
 
+        max_results = min(max_results, SEARCH_RESULT_LIMIT)
+        first = self._search_page(query, fields, 0, min(PAGE_SIZE, max_results))
+        papers = first.get("data", [])
+
+        end = min(max_results, first.get("total", len(papers)))
+        pages = [
+            (offset, min(PAGE_SIZE, end - offset))
+            for offset in range(PAGE_SIZE, end, PAGE_SIZE)
+        ]
+        if not pages:
+            return papers
+
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+            for page in executor.map(
+                lambda page: self._search_page(query, fields, *page), pages
+            ):
+                papers.extend(page.get("data", []))
+        return papers
+
+    def _search_page(self, query: str, fields: str, offset: int, limit: int) -> Dict:
+        """Fetch one page of search results, with the query's "total"."""
+
         params = {
             "query": query,
-            "limit": min(max_results, 100),
+            "limit": limit,
             "fields": fields,
-            "offset": 0,
+            "offset": offset,
         }
 
-        result = self._make_request("paper/search", params)
-        return result.get("data", [])
+        return self._make_request("paper/search", params)
 
     def get_paper(self, paper_id: str, fields: Optional[str] = None) -> Optional[Dict]:
         """Get paper details by ID (DOI, arXiv ID, or Semantic Scholar ID)."""
@@ -123,26 +348,43 @@ class SemanticScholarClient:
         paper_id: str,
         depth: int = 1,
     ) -> Dict:
-        """Get citation network for a paper."""
-
-        paper = self.get_paper(paper_id)
-
-        if not paper:
-            return {"error": "Paper not found"}
-
-        network = {
-            "paper": {
-                "paperId": paper.get("paperId"),
-                "title": paper.get("title"),
-                "year": paper.get("year"),
-            },
-            "citations": [],
-            "references": [],
-        }
-
-        if depth >= 1:
-            network["citations"] = self.get_citations(paper_id, max_results=20)
-            network["references"] = self.get_references(paper_id, max_results=20)
+        """Get citation network for a paper.
+
+        The paper, its citations and its references are requested
+        concurrently rather than one after another, still spaced
+        REQUEST_INTERVAL apart.
+        """
+
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+            paper_future = executor.submit(self.get_paper, paper_id)
+            if depth >= 1:
+                citations_future = executor.submit(
+                    self.get_citations, paper_id, max_results=20
+                )
+                references_future = executor.submit(
+                    self.get_references, paper_id, max_results=20
+                )
+
+            paper = paper_future.result()
+
+            # Citation and reference lookups fail for an unknown paper; that
+            # is reported as "Paper not found" instead
+            if not paper:
+                return {"error": "Paper not found"}
+
+            network = {
+                "paper": {
+                    "paperId": paper.get("paperId"),
+                    "title": paper.get("title"),
+                    "year": paper.get("year"),
+                },
+                "citations": [],
+                "references": [],
+            }
+
+            if depth >= 1:
+                network["citations"] = citations_future.result()
+                network["references"] = references_future.result()
 
         return network
 
@@ -155,8 +397,8 @@ def format_paper(paper: Dict, include_abstract: bool = False) -> str:
 
     authors = paper.get("authors", [])
     if authors:
-        author_names = [a.get("name", "") for a in authors[:3]]
-        lines.append(f"Authors: {', '.join(author_names)}")
+        author_names = ", ".join(a.get("name", "") for a in islice(authors, 3))
+        lines.append(f"Authors: {author_names}")
 
     if paper.get("year"):
         lines.append(f"Year: {paper.get('year')}")
@@ -234,6 +476,11 @@ Environment Variables:
         action="store_true",
         help="Include abstract in output",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always download responses instead of revalidating cached ones",
+    )
 
     args = parser.parse_args()
 
@@ -246,7 +493,7 @@ Environment Variables:
             parser.error("--citations and --references require --paper-id")
 
     # Create client
-    client = SemanticScholarClient(api_key=args.api_key)
+    client = SemanticScholarClient(api_key=args.api_key, use_cache=not args.no_cache)
 
     try:
         if args.paper_id:
@@ -260,8 +507,7 @@ Environment Variables:
 
                 output = network
                 if args.output:
-                    with open(args.output, "w", encoding="utf-8") as f:
-                        json.dump(output, f, indent=2)
+                    _write_json(output, args.output)
                     print(f"Citation network saved to: {args.output}")
                 else:
                     print(f"\nPaper: {network['paper']['title']}")
@@ -283,8 +529,7 @@ Environment Variables:
 
                 output = paper
                 if args.output:
-                    with open(args.output, "w", encoding="utf-8") as f:
-                        json.dump(output, f, indent=2)
+                    _write_json(output, args.output)
                     print(f"Paper details saved to: {args.output}")
                 else:
                     print(format_paper(paper, include_abstract=args.abstract))
@@ -299,8 +544,7 @@ Environment Variables:
             output = papers
 
             if args.output:
-                with open(args.output, "w", encoding="utf-8") as f:
-                    json.dump(output, f, indent=2)
+                _write_json(output, args.output)
                 print(f"Results saved to: {args.output}")
             else:
                 for i, paper in enumerate(papers, 1):
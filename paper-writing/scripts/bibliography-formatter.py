@@ -2,15 +2,71 @@
 """Bibliography Formatter - Format and validate BibTeX entries."""
 
 import argparse
-import re
+import functools
+import io
+import mmap
+import operator
 import sys
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, TextIO
+
+# States of the BibTeXFormatter._parse_bibtex scanner
+_SEEK_AT, _READ_TYPE, _READ_KEY, _READ_FIELDS, _READ_VALUE = range(5)
+
+# @-blocks that hold no citation entry
+_NON_ENTRY_TYPES = {"comment", "preamble", "string"}
+
+# Characters allowed between two fields of an entry
+_FIELD_SEPARATORS = b", \t\r\n"
+
+# Files at least this large are memory-mapped rather than read into memory
+MMAP_THRESHOLD = 1 << 20
+
+
+def _find_closing_brace(content: bytes, pos: int) -> int:
+    """Return the index just past the brace closing one opened before pos.
+
+    Jumps between braces with find() rather than stepping through every
+    character; returns -1 if the brace is never closed.
+    """
+    depth = 1
+    while depth:
+        close = content.find(b"}", pos)
+        if close == -1:
+            return -1
+        open_ = content.find(b"{", pos, close)
+        if open_ == -1:
+            depth -= 1
+            pos = close + 1
+        else:
+            depth += 1
+            pos = open_ + 1
+    return pos
+
+
+def _find_closing_quote(content: bytes, pos: int) -> int:
+    """Return the index just past the quote closing one opened before pos.
+
+    A quote inside braces, as in ``"a {"} b"``, does not end the value;
+    returns -1 if the value is never closed.
+    """
+    while True:
+        quote = content.find(b'"', pos)
+        if quote == -1:
+            return -1
+        open_ = content.find(b"{", pos, quote)
+        if open_ == -1:
+            return quote + 1
+        pos = _find_closing_brace(content, open_ + 1)
+        if pos == -1:
+            return -1
 
 
 class BibTeXFormatter:
     """Format and normalize BibTeX entries."""
 
+    __slots__ = ("style", "entries")
+
     # Field ordering for clean output
     FIELD_ORDER = [
         "author",
@@ -35,98 +91,192 @@ class BibTeXFormatter:
         "crossref",
     ]
 
+    # Position of each field in FIELD_ORDER, for O(1) lookups
+    FIELD_ORDER_INDEX = {name: i for i, name in enumerate(FIELD_ORDER)}
+
     def __init__(self, style: str = "IEEE"):
         self.style = style
         self.entries: Dict[str, Dict] = {}
 
     def parse_file(self, filepath: str) -> None:
-        """Parse BibTeX file."""
-        content = Path(filepath).read_text()
-        self.entries = self._parse_bibtex(content)
-
-    def _parse_bibtex(self, content: str) -> Dict[str, Dict]:
-        """Parse BibTeX content into dictionary."""
+        """Parse BibTeX file.
+
+        Large files are memory-mapped so the parser reads them in place;
+        only the keys and field values it returns are decoded.
+        """
+        path = Path(filepath)
+        if path.stat().st_size < MMAP_THRESHOLD:
+            self.entries = self._parse_bibtex(path.read_bytes())
+            return
+        with open(path, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as content:
+            self.entries = self._parse_bibtex(content)
+
+    def _parse_bibtex(self, content: bytes) -> Dict[str, Dict]:
+        """Parse UTF-8 BibTeX content (bytes or an mmap) into dictionary.
+
+        A single left-to-right pass over content. Each step jumps with
+        find() to the next character that can change the scanner state
+        (``@``, ``{``, ``,``, ``=``, a closing brace or a quote), so the
+        text in between is never walked character by character in Python.
+        Field values may be braced (with nesting), quoted or bare.
+        """
         entries = {}
-        # Match @type{citation_key, ...}
-        entry_pattern = r"@(\w+)\s*\{\s*([^,]+),"
-
-        for match in re.finditer(entry_pattern, content):
-            entry_type = match.group(1)
-            citation_key = match.group(2).strip()
-
-            # Find the matching closing brace
-            start = match.end()
-            depth = 1
-            end = start
-            for i, char in enumerate(content[start:], start):
-                if char == "{":
-                    depth += 1
-                elif char == "}":
-                    depth -= 1
-                if depth == 0:
-                    end = i
+        size = len(content)
+        state = _SEEK_AT
+        i = 0
+        entry_type = citation_key = name = ""
+        fields: Dict[str, str] = {}
+
+        while i < size:
+            if state == _SEEK_AT:
+                i = content.find(b"@", i)
+                if i == -1:
                     break
+                i += 1
+                state = _READ_TYPE
 
-            entry_content = content[start:end]
-            fields = self._parse_fields(entry_content)
-            entries[citation_key] = {"type": entry_type, **fields}
+            elif state == _READ_TYPE:
+                brace = content.find(b"{", i)
+                if brace == -1:
+                    break
+                entry_type = content[i:brace].rstrip().decode("utf-8")
+                if not entry_type.isidentifier():
+                    # A stray "@", e.g. an email address outside any entry
+                    state = _SEEK_AT
+                elif entry_type.lower() in _NON_ENTRY_TYPES:
+                    i = _find_closing_brace(content, brace + 1)
+                    if i == -1:
+                        break
+                    state = _SEEK_AT
+                else:
+                    i = brace + 1
+                    state = _READ_KEY
+
+            elif state == _READ_KEY:
+                comma = content.find(b",", i)
+                close = content.find(b"}", i, size if comma == -1 else comma)
+                if close != -1:
+                    # Entry without fields, e.g. @misc{key}
+                    citation_key = content[i:close].strip().decode("utf-8")
+                    entries[citation_key] = {"type": entry_type}
+                    i = close + 1
+                    state = _SEEK_AT
+                elif comma == -1:
+                    break
+                else:
+                    citation_key = content[i:comma].strip().decode("utf-8")
+                    fields = {"type": entry_type}
+                    i = comma + 1
+                    state = _READ_FIELDS
+
+            elif state == _READ_FIELDS:
+                close = content.find(b"}", i)
+                equals = content.find(b"=", i, size if close == -1 else close)
+                if equals == -1:
+                    # Only separators left before the entry's closing brace
+                    entries[citation_key] = fields
+                    if close == -1:
+                        break
+                    i = close + 1
+                    state = _SEEK_AT
+                else:
+                    name = content[i:equals].strip(_FIELD_SEPARATORS)
+                    name = name.decode("utf-8").lower()
+                    i = equals + 1
+                    state = _READ_VALUE
+
+            else:  # _READ_VALUE
+                while content[i : i + 1].isspace():
+                    i += 1
+                opener = content[i : i + 1]
+                if opener == b"{":
+                    end = _find_closing_brace(content, i + 1)
+                    value = content[i + 1 : end - 1]
+                elif opener == b'"':
+                    end = _find_closing_quote(content, i + 1)
+                    value = content[i + 1 : end - 1]
+                else:
+                    comma = content.find(b",", i)
+                    end = content.find(b"}", i)
+                    if comma != -1 and (end == -1 or comma < end):
+                        end = comma
+                    value = content[i:end]
+                if end == -1:
+                    # Unterminated value: keep the fields read so far
+                    entries[citation_key] = fields
+                    break
+                fields[name] = value.strip().decode("utf-8")
+                i = end
+                state = _READ_FIELDS
+        else:
+            if state in (_READ_FIELDS, _READ_VALUE):
+                entries[citation_key] = fields
 
         return entries
 
-    def _parse_fields(self, content: str) -> Dict[str, str]:
-        """Parse fields from entry content."""
-        fields = {}
-        # Match field = value
-        field_pattern = r"(\w+)\s*=\s*\{([^{}]*(?:\{[^{}]*\}[^{}]*)*)\}"
-
-        for match in re.finditer(field_pattern, content):
-            field_name = match.group(1).lower()
-            field_value = match.group(2).strip()
-            fields[field_name] = field_value
-
-        return fields
-
     def format_entry(self, citation_key: str) -> str:
         """Format a single entry."""
         if citation_key not in self.entries:
             return f"Error: Citation key '{citation_key}' not found"
 
-        entry = self.entries[citation_key]
-        entry_type = entry.pop("type")
+        buf = io.StringIO()
+        self._write_entry(citation_key, buf)
+        return buf.getvalue()
 
-        lines = [f"@{entry_type}{{{citation_key},"]
+    def _write_entry(self, citation_key: str, fp: TextIO) -> None:
+        """Write an existing entry to fp, without a trailing newline."""
+        # Read-only: the entry stays intact for later calls and validate()
+        entry = self.entries[citation_key]
+        entry_type = entry.get("type", "misc")
 
-        # Order fields
-        for field in self.FIELD_ORDER:
-            if field in entry:
-                lines.append(f"  {field} = {{{entry[field]}}},")
+        fp.write(f"@{entry_type}{{{citation_key},\n")
 
-        # Add any remaining fields
-        for field, value in entry.items():
-            if field not in self.FIELD_ORDER:
-                lines.append(f"  {field} = {{{value}}},")
+        # Fields in FIELD_ORDER first, then any others; the sort is stable,
+        # so the others keep their order from the file
+        index = self.FIELD_ORDER_INDEX
+        unordered = len(index)
+        fields = sorted(
+            (item for item in entry.items() if item[0] != "type"),
+            key=lambda item: index.get(item[0], unordered),
+        )
+        fp.writelines(f"  {field} = {{{value}}},\n" for field, value in fields)
 
-        lines.append("}")
-        return "\n".join(lines)
+        fp.write("}")
 
     def format_all(self) -> str:
         """Format all entries."""
-        return "\n\n".join(
-            self.format_entry(key) for key in sorted(self.entries.keys())
-        )
+        buf = io.StringIO()
+        self.write_to(buf)
+        return buf.getvalue()
+
+    def write_to(self, fp: TextIO) -> None:
+        """Write the text of format_all() to the text file fp.
+
+        Entries are written one at a time, so the whole bibliography is
+        never built as a single string.
+        """
+        for i, key in enumerate(sorted(self.entries)):
+            if i:
+                fp.write("\n\n")
+            self._write_entry(key, fp)
 
     def sort_by_author(self) -> Dict[str, Dict]:
         """Sort entries by first author name."""
 
         def get_first_author(entry):
-            authors = entry.get("author", "").split(" and ")
-            if authors:
-                # Get last name of first author
-                first = authors[0].strip().split()[-1]
-                return first.lower()
+            # Get last name of first author, splitting only as far as needed
+            first = entry.get("author", "").split(" and ", 1)[0]
+            names = first.rsplit(None, 1)
+            if names:
+                return names[-1].lower()
             return "zzz"
 
-        return dict(sorted(self.entries.items(), key=lambda x: get_first_author(x[1])))
+        # Compute each key once, then sort on it alone
+        keyed = [(get_first_author(e), k, e) for k, e in self.entries.items()]
+        keyed.sort(key=operator.itemgetter(0))
+        return {k: e for _, k, e in keyed}
 
     def validate(self, citation_key: Optional[str] = None) -> List[str]:
         """Validate entries for common issues."""
@@ -150,8 +300,9 @@ class BibTeXFormatter:
 
             # Check year format
             if "year" in entry:
-                if not re.match(r"^\d{4}$", entry["year"]):
-                    errors.append(f"{key}: Invalid year format '{entry['year']}'")
+                year = entry["year"]
+                if len(year) != 4 or not year.isdecimal():
+                    errors.append(f"{key}: Invalid year format '{year}'")
 
         if citation_key:
             if citation_key in self.entries:
@@ -197,8 +348,13 @@ class BibTeXFormatter:
 
         return "\n".join(lines)
 
-    def _format_author_apa(self, author: str) -> str:
-        """Format author name for APA style."""
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _format_author_apa(author: str) -> str:
+        """Format author name for APA style.
+
+        Cached, since co-authors recur across the entries of a bibliography.
+        """
         parts = author.strip().split()
         if len(parts) >= 2:
             last = parts[-1]
@@ -246,6 +402,13 @@ def main():
         formatter.entries = formatter.sort_by_author()
 
     # Output
+    if args.output and not (args.convert or args.key):
+        # Write the entries straight to the file rather than via one string
+        with open(args.output, "w") as f:
+            formatter.write_to(f)
+        print(f"Output written to {args.output}")
+        return
+
     if args.convert:
         output = formatter.convert_style(args.convert)
     else: